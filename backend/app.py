@@ -1,31 +1,53 @@
 from flask import Flask
 from flask_cors import CORS
 from extensions import db, migrate
+from commands import dbRouting
 from config import Config
 
-app = Flask(__name__)
-CORS(app)
-app.config.from_object(Config)
-
-db.init_app(app)
-migrate.init_app(app, db)
-
-# Import and register blueprints
+# Blueprints and CLI commands are imported once, at module import time
 from controllers.userController import user_bp
 from controllers.bookingController import booking_bp
 from controllers.tabelsControllers import tables_bp
 from controllers.foodController import food_bp
 from controllers.oderContoller import order_bp
+from controllers.metricsController import metrics_bp
+from commands.receiptCli import receipts_cli
+from commands.tableCli import tables_cli
+from commands.indexCli import indexes_cli
+from commands.loadTestCli import loadtest_cli
 
-app.register_blueprint(user_bp, url_prefix="/users")
-app.register_blueprint(booking_bp, url_prefix="/bookings")
-app.register_blueprint(tables_bp, url_prefix="/tables")
-app.register_blueprint(food_bp,url_prefix="/menu")
-app.register_blueprint(order_bp,url_prefix="/orders")
 
-if __name__ == "__main__":
+def create_app(config_class=Config):
+    """Build the Flask app; used by `flask run`, wsgi.py and scripts alike."""
+    app = Flask(__name__)
+    app.config.from_object(config_class)
+    # Must be set before any route is added: rules read it when registered.
+    # /menu and /menu/ then both answer directly instead of redirecting
     app.url_map.strict_slashes = False
-    app.run(debug=True)
-    CORS(app)
-    CORS(app, resources={r"/users/*": {"origins": "*"}})
+    # The SPA reads X-DB-Primary-Until off write responses (see commands/dbRouting.py)
+    CORS(app, expose_headers=[dbRouting.PRIMARY_UNTIL_HEADER])
+
+    db.init_app(app)
+    migrate.init_app(app, db)
+    dbRouting.init_app(app)
+
+    app.register_blueprint(user_bp, url_prefix="/users")
+    app.register_blueprint(booking_bp, url_prefix="/bookings")
+    app.register_blueprint(tables_bp, url_prefix="/tables")
+    app.register_blueprint(food_bp, url_prefix="/menu")
+    app.register_blueprint(order_bp, url_prefix="/orders")
+    app.register_blueprint(metrics_bp, url_prefix="/metrics")
 
+    # CLI commands (flask receipts rebuild, flask tables benchmark-allocator,
+    # flask indexes benchmark, flask loadtest run)
+    app.cli.add_command(receipts_cli)
+    app.cli.add_command(tables_cli)
+    app.cli.add_command(indexes_cli)
+    app.cli.add_command(loadtest_cli)
+
+    return app
+
+
+if __name__ == "__main__":
+    # Development server only; production runs wsgi:app under gunicorn
+    create_app().run(debug=True)
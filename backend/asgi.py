@@ -0,0 +1,73 @@
+"""ASGI entry point: uvicorn asgi:app (or hypercorn asgi:app)
+
+Routes with an async variant (async_order_bp, async_food_bp) run on Quart
+and the async SQLAlchemy engine, so a request waiting on MySQL parks a
+coroutine instead of a worker thread. Every other route is the regular
+Flask app, run in a thread pool. Needs the async extras: quart,
+quart-cors, asgiref and aiomysql (aiosqlite for SQLite).
+
+Replica routing matches the sync app: async GET /orders and GET /menu
+read from the DATABASE_REPLICA_URLS replicas (through their async
+drivers), and async writes answer with X-DB-Primary-Until so clients
+that echo it keep reading the primary.
+
+To compare the two servers, start gunicorn wsgi:app and uvicorn asgi:app
+on the same database and point `flask loadtest run --path /menu/ --path
+"/orders/?limit=50"` at each. The async side only pays off once requests
+spend real time waiting on the database; on SQLite it is slightly slower.
+"""
+from asgiref.wsgi import WsgiToAsgi
+from quart import Quart
+from quart_cors import cors
+from werkzeug.exceptions import HTTPException
+from app import create_app
+from commands.asyncDb import init_async_db
+from commands.dbRouting import PRIMARY_UNTIL_HEADER
+from config import Config
+from controllers.asyncFoodController import async_food_bp
+from controllers.asyncOrderController import async_order_bp
+
+
+def create_async_app(config_class=Config):
+    app = Quart(__name__)
+    app.config.from_object(config_class)
+    app.url_map.strict_slashes = False  # Same URL behaviour as the Flask app
+    app = cors(app, allow_origin="*", expose_headers=[PRIMARY_UNTIL_HEADER])
+
+    init_async_db(app)
+
+    app.register_blueprint(async_order_bp, url_prefix="/orders")
+    app.register_blueprint(async_food_bp, url_prefix="/menu")
+    return app
+
+
+class RouteDispatcher:
+    """Send each request to the async app when its route has an async twin.
+
+    The path is matched against the Flask URL map, so both apps agree on
+    which route a URL means (e.g. /orders/export never reaches the async
+    /orders/<order_id>). Endpoint `x_bp.view` has an async twin when the
+    Quart app defines `async_x_bp.view`.
+    """
+
+    def __init__(self, flask_app, async_app):
+        self.flask_app = flask_app
+        self.async_app = async_app
+        self.wsgi = WsgiToAsgi(flask_app)
+
+    def _has_async_twin(self, scope):
+        adapter = self.flask_app.url_map.bind("", script_name=scope.get("root_path") or None)
+        try:
+            endpoint, _ = adapter.match(scope["path"], method=scope["method"])
+        except HTTPException:
+            return False  # 404/405/redirect: let Flask answer as it always has
+        return f"async_{endpoint}" in self.async_app.view_functions
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan" or (scope["type"] == "http" and self._has_async_twin(scope)):
+            await self.async_app(scope, receive, send)
+        else:
+            await self.wsgi(scope, receive, send)
+
+
+app = RouteDispatcher(create_app(), create_async_app())
@@ -0,0 +1,80 @@
+import random
+from quart import request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from commands.dbRouting import PRIMARY_UNTIL_HEADER, REPLICA_BIND_PREFIX, primary_until, wants_primary
+
+# Sync driver -> asyncio driver for the same database
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+mysqlconnector": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_url(url):
+    """The asyncio flavour of a SQLAlchemy URL, e.g. mysql+aiomysql:// for mysql+mysqlconnector://."""
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        raise ValueError(f"No asyncio driver known for {url.drivername}; set ASYNC_DATABASE_URL")
+    return url.set(drivername=driver)
+
+
+def init_async_db(app):
+    """Create the app's async engines and session factories.
+
+    The pools use the same DB_POOL_* settings as the sync engine. Many
+    concurrent requests share those few connections: a request that waits
+    on the pool or on MySQL only parks a coroutine, not a thread.
+
+    Each replica_* entry of SQLALCHEMY_BINDS gets an async engine too, for
+    `async_session(app, read_only=True)`. As in dbRouting, a successful
+    write answers with PRIMARY_UNTIL_HEADER so the client's next reads
+    stay on the primary.
+    """
+    config = app.config
+    pool_options = dict(
+        pool_size=config["DB_POOL_SIZE"],
+        max_overflow=config["DB_MAX_OVERFLOW"],
+        pool_timeout=config["DB_POOL_TIMEOUT"],
+        pool_recycle=config["DB_POOL_RECYCLE"],
+        pool_pre_ping=config["DB_POOL_PRE_PING"],
+    )
+    url = config.get("ASYNC_DATABASE_URL") or async_database_url(config["SQLALCHEMY_DATABASE_URI"])
+    engine = create_async_engine(url, **pool_options)
+    replica_engines = [
+        create_async_engine(async_database_url(replica_url), **pool_options)
+        for key, replica_url in (config.get("SQLALCHEMY_BINDS") or {}).items()
+        if key.startswith(REPLICA_BIND_PREFIX)
+    ]
+    # expire_on_commit=False: rows stay readable after commit without
+    # another (implicit, and in asyncio illegal) lazy load
+    app.extensions["async_db"] = async_sessionmaker(engine, expire_on_commit=False)
+    app.extensions["async_db_replicas"] = [async_sessionmaker(e, expire_on_commit=False) for e in replica_engines]
+
+    @app.after_request
+    async def set_primary_until(response):
+        if replica_engines and request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+            response.headers[PRIMARY_UNTIL_HEADER] = primary_until(config.get("REPLICA_STICKY_SECONDS", 5))
+        return response
+
+    @app.after_serving
+    async def dispose_async_engines():
+        for e in [engine, *replica_engines]:
+            await e.dispose()
+
+
+def async_session(app, read_only=False):
+    """A new AsyncSession; use as `async with async_session(current_app) as session:`.
+
+    With read_only=True the session reads from a random replica, unless
+    none is configured or the client sent back an unexpired
+    PRIMARY_UNTIL_HEADER. Never write through a read_only session.
+    """
+    replicas = app.extensions["async_db_replicas"]
+    if read_only and replicas and not wants_primary(request.headers):
+        return random.choice(replicas)()
+    return app.extensions["async_db"]()
@@ -0,0 +1,65 @@
+from quart import current_app
+from sqlalchemy import select
+from commands.asyncDb import async_session
+from commands.foodCommands import menu_cache
+from commands.menuPayload import MenuPayload
+from config import Config
+from dto.foodItem import FoodItemDTO
+from models import FoodItem
+
+
+class AsyncFoodCommands:
+    """asyncio twins of the FoodCommands reads, sharing the same menu cache.
+
+    A cache miss is loaded on the async engine; the entry is then served
+    to both the sync and async blueprints until the next invalidation.
+    """
+
+    @staticmethod
+    async def _get_or_load(key, loader):
+        value = menu_cache.get(key)
+        if value is None:
+            checkpoint = menu_cache.checkpoint()  # Taken before loading, as in LRUCache.get_or_load
+            value = await loader()
+            menu_cache.set(key, value, checkpoint)
+        return value
+
+    @staticmethod
+    async def get_all_food_items(category=None):
+        return await AsyncFoodCommands._get_or_load(
+            ("items", category or None), lambda: AsyncFoodCommands._load_food_items(category)
+        )
+
+    @staticmethod
+    async def _load_food_items(category=None):
+        statement = select(FoodItem)
+        if category:
+            statement = statement.where(FoodItem.category == category)
+        async with AsyncFoodCommands._read_session() as session:
+            food_items = (await session.scalars(statement)).all()
+        return [FoodItemDTO(item.id, item.name, item.description, item.price, item.image_url, item.category) for item in food_items]
+
+    @staticmethod
+    async def get_menu_payload(category=None):
+        """Serialized GET /menu response, built once per menu version."""
+        async def load():
+            items = await AsyncFoodCommands.get_all_food_items(category)
+            return MenuPayload([item.to_dict() for item in items], current_app.json.dumps)
+
+        return await AsyncFoodCommands._get_or_load(("payload", category or None), load)
+
+    @staticmethod
+    async def get_all_categories():
+        return await AsyncFoodCommands._get_or_load(("categories",), AsyncFoodCommands._load_categories)
+
+    @staticmethod
+    async def _load_categories():
+        async with AsyncFoodCommands._read_session() as session:
+            categories = (await session.scalars(select(FoodItem.category).distinct())).all()
+        return list(categories)
+
+    @staticmethod
+    def _read_session():
+        # Replica reads, except right after a menu write: that fill is kept
+        # until the TTL, so it must come from the primary (as in FoodCommands)
+        return async_session(current_app, read_only=not menu_cache.invalidated_within(Config.REPLICA_STICKY_SECONDS))
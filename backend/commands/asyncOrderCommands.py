@@ -0,0 +1,104 @@
+from decimal import Decimal
+from quart import current_app, jsonify
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from commands.asyncDb import async_session
+from commands.orderCommands import OrderCommands
+from commands.pagination import paginate_async, page_response
+from commands.receiptQueue import receipt_cache
+from constants.enums import OrderStatus
+from models import FoodItem, Order, OrderItem, generate_uuid
+
+
+class AsyncOrderCommands:
+    """asyncio twins of the OrderCommands the async order blueprint serves.
+
+    Same queries and response bodies as the sync versions, run on the
+    async engine (see asgi.py).
+    """
+
+    # 🟢 Create Order
+    @staticmethod
+    async def place_order(user_id, order_items):
+        error = OrderCommands.validate_order_items(order_items)
+        if error:
+            return jsonify({"error": error}), 400
+
+        async with async_session(current_app) as session:
+            # Resolve every requested name in one IN (...) query
+            names = {item["name"] for item in order_items}
+            foods_by_name = {}
+            for food in await session.scalars(select(FoodItem).where(FoodItem.name.in_(names))):
+                foods_by_name.setdefault(food.name, food)
+
+            missing = sorted(names - foods_by_name.keys())
+            if missing:
+                return jsonify({
+                    "error": f"Food items not found: {', '.join(missing)}",
+                    "missing": missing
+                }), 404
+
+            # Prices come from the menu, never the client
+            new_order = Order(
+                id=generate_uuid(),
+                user_id=user_id,
+                status=OrderStatus.PENDING.value,
+                order_items=[]
+            )
+            for item in order_items:
+                food = foods_by_name[item["name"]]
+                new_order.order_items.append(OrderItem(
+                    order_id=new_order.id,
+                    food_id=food.id,
+                    food_name=food.name,
+                    unit_price=food.price,
+                    quantity=item["quantity"]
+                ))
+            new_order.total_price = sum((item.unit_price * item.quantity for item in new_order.order_items), Decimal("0.00"))
+
+            session.add(new_order)
+            response = OrderCommands.order_to_dict(new_order)
+            await session.commit()
+
+        return jsonify(response), 201
+
+    # 🔍 Get Individual Order
+    @staticmethod
+    async def get_order_by_id(order_id):
+        async with async_session(current_app) as session:
+            order = await session.scalar(
+                select(Order).options(selectinload(Order.order_items)).where(Order.id == order_id)
+            )
+            if not order:
+                return jsonify({"error": "Order not found"}), 404
+            return jsonify(OrderCommands.order_to_dict(order)), 200
+
+    # 🟠 Update Order Status
+    @staticmethod
+    async def update_order_status(order_id, status):
+        async with async_session(current_app) as session:
+            order = await session.get(Order, order_id)
+            if not order:
+                return jsonify({"error": "Order not found"}), 404
+
+            if status not in [s.value for s in OrderStatus]:
+                return jsonify({"error": "Invalid status"}), 400
+
+            order.status = status
+            await session.commit()
+        receipt_cache.invalidate(order_id)  # The receipt shows the status
+
+        return jsonify({"message": "Order status updated successfully", "status": status})
+
+    # 📝 Get All Orders
+    @staticmethod
+    async def get_all_orders(page=None):
+        statement = select(Order).options(selectinload(Order.order_items))
+        async with async_session(current_app, read_only=True) as session:
+            if page is None:
+                orders = (await session.scalars(statement)).all()
+                return jsonify([OrderCommands.order_to_dict(order) for order in orders])
+
+            limit, after = page
+            orders, next_cursor = await paginate_async(session, statement, Order.id, limit, after)
+            return jsonify(page_response([OrderCommands.order_to_dict(order) for order in orders], next_cursor))
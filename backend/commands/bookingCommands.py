@@ -1,15 +1,24 @@
 import datetime
 from flask import jsonify
+from sqlalchemy.orm import selectinload
+from commands.pagination import iter_pages
+from commands.streaming import stream_records
+from commands.tableAllocator import TableAllocator
+from commands.tableAvailability import get_day_availability, invalidate_reservations, load_day_availability, slot_bounds
+from config import Config
 from constants.enums import BookingStatus
 from dto.tabelDto import TableDTO
-from models import Table, TableBooking
+from models import Table, TableBooking, TableReservation
 import uuid
 from dto.bookingDto import BookingDTO
 from extensions import db
 
+MAX_BOOKING_MINUTES = 12 * 60
+MAX_PARTY_SIZE = 50
+
 class BookingCommands:
     @staticmethod
-    def create_booking(user_id, date, time):
+    def create_booking(user_id, date, time, duration_minutes=None, party_size=None):
         try:
             # Ensure user_id is in UUID string format
             user_id_bytes = str(uuid.UUID(user_id))  # Ensure user_id is a string representation of UUID
@@ -25,11 +34,33 @@ class BookingCommands:
             except ValueError:
                 return jsonify({"error": "Invalid date format. Use DD-MM-YYYY."}), 400
 
+            # How long the table is held
+            if duration_minutes is None:
+                duration_minutes = Config.BOOKING_DURATION_MINUTES
+            try:
+                duration_minutes = int(duration_minutes)
+            except (TypeError, ValueError):
+                duration_minutes = 0
+            if not 0 < duration_minutes <= MAX_BOOKING_MINUTES:
+                return jsonify({"error": f"duration_minutes must be between 1 and {MAX_BOOKING_MINUTES}."}), 400
+
+            # How many guests need seats
+            if party_size is None:
+                party_size = 2
+            try:
+                party_size = int(party_size)
+            except (TypeError, ValueError):
+                party_size = 0
+            if not 0 < party_size <= MAX_PARTY_SIZE:
+                return jsonify({"error": f"party_size must be between 1 and {MAX_PARTY_SIZE}."}), 400
+
             # Create the booking
             new_booking = TableBooking(
                 user_id=user_id_bytes,
                 date=booking_date,
                 time=time,
+                duration_minutes=duration_minutes,
+                party_size=party_size,
                 status=BookingStatus.PENDING.value  # Use Enum for status
             )
             db.session.add(new_booking)
@@ -41,7 +72,9 @@ class BookingCommands:
                 new_booking.user_id,
                 new_booking.date,
                 new_booking.time,
-                new_booking.status
+                new_booking.status,
+                duration_minutes=new_booking.duration_minutes,
+                party_size=new_booking.party_size
             )
             return jsonify(booking_dto.to_dict()), 201
 
@@ -55,10 +88,20 @@ class BookingCommands:
         try:
             bookings = TableBooking.query.all()
             # Return all bookings converted into DTOs
-            return jsonify([BookingDTO(b.id, b.user_id, b.date, b.time, b.status).to_dict() for b in bookings]), 200
+            return jsonify([BookingDTO(b.id, b.user_id, b.date, b.time, b.status, duration_minutes=b.duration_minutes, party_size=b.party_size).to_dict() for b in bookings]), 200
         except Exception as e:
             return jsonify({"error": str(e)}), 500
         
+    @staticmethod
+    def export_bookings(fmt="ndjson"):
+        # Walk the whole table in keyset batches so memory stays bounded
+        query = TableBooking.query.options(selectinload(TableBooking.tables))
+        bookings = (
+            BookingDTO(b.id, b.user_id, b.date, b.time, b.status, b.tables, b.duration_minutes, b.party_size).to_dict()
+            for b in iter_pages(query, TableBooking.id)
+        )
+        return stream_records(bookings, fmt, filename="bookings")
+
     @staticmethod
     def get_all_bookings_by_user(user_id):
         try:
@@ -76,7 +119,7 @@ class BookingCommands:
                 return {"message": "No bookings found for the given user_id."}, 404
 
             # Return the bookings in the response as DTOs (just return the data, not jsonify here)
-            booking_data = [BookingDTO(b.id, b.user_id, b.date, b.time, b.status).to_dict() for b in bookings]
+            booking_data = [BookingDTO(b.id, b.user_id, b.date, b.time, b.status, duration_minutes=b.duration_minutes, party_size=b.party_size).to_dict() for b in bookings]
             return booking_data, 200 
 
         except Exception as e:
@@ -105,7 +148,9 @@ class BookingCommands:
                 booking.user_id,
                 booking.date,
                 booking.time,
-                booking.status
+                booking.status,
+                duration_minutes=booking.duration_minutes,
+                party_size=booking.party_size
             )
             return jsonify(booking_dto.to_dict()), 200
 
@@ -132,7 +177,9 @@ class BookingCommands:
                 booking.user_id,
                 booking.date,
                 booking.time,
-                booking.status
+                booking.status,
+                duration_minutes=booking.duration_minutes,
+                party_size=booking.party_size
             )
             return jsonify(booking_dto.to_dict()), 200
 
@@ -144,12 +191,25 @@ class BookingCommands:
         try:
             # Ensure booking_id is in string format
             booking_id = str(booking_id)
+
+            # Lock the booking's tables first, in the same order as
+            # assign_table, so the two can't deadlock
+            (Table.query
+             .filter(Table.id.in_(db.session.query(TableReservation.table_id).filter_by(booking_id=booking_id))
+                     | (Table.booking_id == booking_id))
+             .order_by(Table.id).with_for_update().all())
+
             booking = TableBooking.query.get(booking_id)
             if not booking:
+                db.session.rollback()
                 return jsonify({"error": "Booking not found"}), 404
 
+            # Explicitly: SQLite doesn't enforce the ON DELETE CASCADE
+            booking_date = booking.date
+            TableReservation.query.filter_by(booking_id=booking.id).delete()
             db.session.delete(booking)
             db.session.commit()
+            invalidate_reservations(booking_date)
             return jsonify({"message": "Booking deleted successfully"}), 200
 
         except Exception as e:
@@ -160,47 +220,63 @@ class BookingCommands:
         try:
             # Ensure booking_id is in string format
             booking_id = str(booking_id)
+
+            # Lock the table rows before reading anything else: concurrent
+            # assignments of the same table queue here. Under REPEATABLE READ
+            # the snapshot is taken at the first plain read, so it must come
+            # after the lock or it can miss a reservation committed meanwhile
+            tables = (Table.query.filter_by(table_number=table_number)
+                      .order_by(Table.id).with_for_update().all())
+
             booking = TableBooking.query.get(booking_id)
 
             if not booking:
+                db.session.rollback()
                 return jsonify({"error": "Booking not found"}), 404
 
-            # Find the table by table_number for the specified booking date
-            table = Table.query.filter_by(table_number=table_number).first()
-
-            if not table:
+            if not tables:
+                db.session.rollback()
                 return jsonify({"error": "Table not found for this booking on the specified date."}), 400
 
+            starts_at, ends_at = slot_bounds(booking.date, booking.time, booking.duration_minutes)
+
+            table = None
+            for candidate in tables:
+                # A locking read sees the latest committed reservations, not
+                # the transaction's snapshot
+                overlapping = db.session.query(TableReservation.id).filter(
+                    TableReservation.table_id == candidate.id,
+                    TableReservation.starts_at < ends_at,
+                    TableReservation.ends_at > starts_at
+                ).with_for_update().first()
+                if overlapping is None:
+                    table = candidate
+                    break
+
             # Check if the table is already booked
-            if table.is_booked:
+            if table is None:
+                db.session.rollback()
                 return jsonify({
-                    "message": f"Table {table_number} is already booked for this date."
+                    "message": f"Table {table_number} is already booked for this time slot."
                 }), 400
 
-            # If the table is not booked, assign it
-            table.booking_id = booking.id
-            table.user_id = booking.user_id
-            table.booking_date = booking.date
-            table.booking_time = booking.time
-            table.booking_status = BookingStatus.CONFIRMED.value  # Update the table status to CONFIRMED
-            table.is_booked = True  # Mark the table as booked
-
-            # Update the booking's status to CONFIRMED as well
-            booking.status = BookingStatus.CONFIRMED.value
+            BookingCommands._reserve(booking, [table], starts_at, ends_at)
 
             # Commit changes to the database
             db.session.commit()
+            invalidate_reservations(booking.date)
 
             # Prepare and return the updated table and booking details
             table_dto = TableDTO(
                 table.id, table.booking_id, table.user_id,
                 table.table_number, table.booking_date, table.booking_time,
-                table.booking_status, table.is_booked
+                table.booking_status, table.is_booked, capacity=table.capacity
             )
 
             booking_dto = BookingDTO(
                 booking.id, booking.user_id, booking.date,
-                booking.time, booking.status
+                booking.time, booking.status, booking.tables,
+                booking.duration_minutes, booking.party_size
             )
 
             return jsonify({
@@ -211,4 +287,156 @@ class BookingCommands:
 
         except Exception as e:
             db.session.rollback()  # Rollback in case of error
-            return jsonify({"error": str(e)}), 500
\ No newline at end of file
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    def auto_assign(booking_id):
+        """Pick the best-fitting free table(s) for one booking and reserve them"""
+        try:
+            booking = TableBooking.query.get(str(booking_id))
+            if not booking:
+                return jsonify({"error": "Booking not found"}), 404
+            if booking.tables:
+                return jsonify({"error": "Booking already has tables assigned."}), 400
+
+            booking_id, day, party_size = booking.id, booking.date, booking.party_size
+            starts_at, ends_at = slot_bounds(booking.date, booking.time, booking.duration_minutes)
+
+            # Plan on the cached index, then lock only the chosen tables, as
+            # assign_table does, and re-check them. The index may be stale:
+            # tables found taken are ruled out and we plan again
+            taken = set()
+            while True:
+                availability = get_day_availability(day).copy()
+                for table_id in taken:
+                    availability.reserve(table_id, starts_at, ends_at)
+                tables = TableAllocator(availability).allocate(party_size, starts_at, ends_at)
+                if not tables:
+                    db.session.rollback()
+                    return jsonify({
+                        "message": f"No free tables seat {party_size} for this time slot."
+                    }), 400
+
+                table_ids = [t[0] for t in tables]
+                rows = BookingCommands._lock_tables(table_ids)
+                # Locking read: sees reservations committed after our snapshot
+                conflicts = {table_id for (table_id,) in db.session.query(TableReservation.table_id).filter(
+                    TableReservation.table_id.in_(table_ids),
+                    TableReservation.starts_at < ends_at,
+                    TableReservation.ends_at > starts_at
+                ).with_for_update().all()}
+                conflicts.update(table_id for table_id in table_ids if table_id not in rows)  # Deleted meanwhile
+                if not conflicts:
+                    break
+
+                db.session.rollback()  # Release the locks before planning again
+                invalidate_reservations(day)
+                taken.update(conflicts)
+
+            # The booking row last, so the lock order matches delete_booking;
+            # it also makes a second auto-assign of this booking wait and
+            # then see our reservations
+            booking = (TableBooking.query.filter_by(id=booking_id)
+                       .populate_existing().with_for_update().first())
+            if not booking:
+                db.session.rollback()
+                return jsonify({"error": "Booking not found"}), 404
+            if db.session.query(TableReservation.id).filter_by(booking_id=booking_id).with_for_update().first():
+                db.session.rollback()
+                return jsonify({"error": "Booking already has tables assigned."}), 400
+
+            BookingCommands._reserve(booking, [rows[table_id] for table_id in table_ids], starts_at, ends_at)
+            db.session.commit()
+            invalidate_reservations(day)
+
+            booking_dto = BookingDTO(
+                booking.id, booking.user_id, booking.date,
+                booking.time, booking.status, booking.tables,
+                booking.duration_minutes, booking.party_size
+            )
+            return jsonify(booking_dto.to_dict()), 200
+
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    def allocate_pending(day):
+        """Seat every pending, unassigned booking on `day` in one pass"""
+        try:
+            # Lock every table up front: the plan below is only valid while
+            # nobody else can reserve in between
+            db.session.query(Table.id).order_by(Table.id).with_for_update().all()
+            availability = load_day_availability(day)
+
+            pending = (
+                TableBooking.query
+                .filter(
+                    TableBooking.date == day,
+                    TableBooking.status == BookingStatus.PENDING.value,
+                    ~TableBooking.id.in_(db.session.query(TableReservation.booking_id))
+                )
+                .all()
+            )
+            by_id = {booking.id: booking for booking in pending}
+            slots = []
+            for booking in pending:
+                starts_at, ends_at = slot_bounds(booking.date, booking.time, booking.duration_minutes)
+                slots.append((booking.id, booking.party_size, starts_at, ends_at))
+
+            allocated, unallocated = TableAllocator(availability).allocate_all(slots)
+
+            rows = BookingCommands._load_tables([t for tables in allocated.values() for t in tables])
+            for booking_id, _, starts_at, ends_at in slots:
+                if booking_id in allocated:
+                    tables = [rows[t[0]] for t in allocated[booking_id]]
+                    BookingCommands._reserve(by_id[booking_id], tables, starts_at, ends_at)
+
+            db.session.commit()
+            invalidate_reservations(day)
+
+            return jsonify({
+                "date": day.isoformat(),
+                "allocated": {
+                    str(booking_id): [table[1] for table in tables]
+                    for booking_id, tables in allocated.items()
+                },
+                "unallocated": [str(booking_id) for booking_id in unallocated]
+            }), 200
+
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    def _load_tables(tables):
+        """Table rows by id for allocator (table_id, table_number, capacity) tuples"""
+        table_ids = list({t[0] for t in tables})
+        if not table_ids:
+            return {}
+        return {table.id: table for table in Table.query.filter(Table.id.in_(table_ids)).all()}
+
+    @staticmethod
+    def _lock_tables(table_ids):
+        """Lock the given table rows, in id order like every other table lock; returns them by id"""
+        tables = Table.query.filter(Table.id.in_(table_ids)).order_by(Table.id).with_for_update().all()
+        return {table.id: table for table in tables}
+
+    @staticmethod
+    def _reserve(booking, tables, starts_at, ends_at):
+        """Add the reservations for `booking` on `tables` and confirm it; the caller commits"""
+        for table in tables:
+            db.session.add(TableReservation(
+                table_id=table.id, booking_id=booking.id, starts_at=starts_at, ends_at=ends_at
+            ))
+
+            # Record the latest assignment on the table itself
+            table.booking_id = booking.id
+            table.user_id = booking.user_id
+            table.booking_date = booking.date
+            table.booking_time = booking.time
+            table.booking_status = BookingStatus.CONFIRMED  # Update the table status to CONFIRMED
+            table.is_booked = True  # Mark the table as booked
+
+        # Update the booking's status to CONFIRMED as well
+        booking.status = BookingStatus.CONFIRMED.value
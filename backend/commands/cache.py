@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Thread-safe in-process cache with TTL, LRU eviction and a version counter.
+
+    Each entry remembers the version it was stored under. `invalidate()`
+    bumps the version, so everything stored before it becomes a miss
+    without walking the whole cache. Loaders take a `checkpoint()` first
+    and hand it to `set()`, which drops the value if its key (or the whole
+    cache) was invalidated while it loaded. Hit/miss/eviction counters are
+    kept for `stats()`.
+
+    The cache lives in a single worker process. Other processes only see
+    changes once their own entries expire, so keep the TTL short enough
+    to bound staleness.
+    """
+
+    def __init__(self, max_entries=128, ttl_seconds=300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        # Bumped by every invalidate(); per key, the generation it was last
+        # invalidated at. A set() with an older checkpoint is stale
+        self.generation = 0
+        self._key_generations = {}
+        self._floor = 0  # Everything up to here counts as invalidated
+        self.invalidated_at = 0.0  # time.monotonic() of the last invalidate()
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                version, expires_at, value = entry
+                if version == self.version and expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def checkpoint(self):
+        """Read before loading a value; pass it to set()."""
+        with self._lock:
+            return self.generation
+
+    def set(self, key, value, checkpoint=None):
+        """Store `value`; pass the `checkpoint()` taken before loading it so a
+        concurrent invalidation isn't overwritten by stale data."""
+        with self._lock:
+            if checkpoint is not None and max(self._floor, self._key_generations.get(key, 0)) > checkpoint:
+                return
+            self._entries[key] = (self.version, time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key, loader):
+        value = self.get(key)
+        if value is None:
+            checkpoint = self.checkpoint()
+            value = loader()
+            self.set(key, value, checkpoint)
+        return value
+
+    def invalidate(self, key=None):
+        """Drop one entry, or everything when no key is given."""
+        with self._lock:
+            self.invalidated_at = time.monotonic()
+            self.generation += 1
+            if key is None:
+                self.version += 1
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+            if key is None or len(self._key_generations) >= self.max_entries:
+                # Forget the per-key stamps; loads already in flight are
+                # dropped, which only costs a cache fill
+                self._floor = self.generation
+                self._key_generations.clear()
+            if key is not None:
+                self._key_generations[key] = self.generation
+
+    def invalidated_within(self, seconds):
+        return time.monotonic() - self.invalidated_at < seconds
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self.version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
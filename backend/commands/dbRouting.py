@@ -0,0 +1,107 @@
+import random
+import time
+from contextlib import contextmanager
+from functools import wraps
+from flask import g, has_app_context, has_request_context, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy.sql import Select
+
+# Sent on responses to writes: the Unix time until which the client should
+# read the primary. The client echoes it back as a request header so its
+# next reads see its own writes despite replica lag. A header rather than a
+# cookie, because the SPA calls the API cross-origin without credentials
+PRIMARY_UNTIL_HEADER = "X-DB-Primary-Until"
+REPLICA_BIND_PREFIX = "replica_"
+
+
+def replica_binds(urls):
+    """SQLALCHEMY_BINDS entries for a comma-separated list of replica URLs."""
+    return {f"{REPLICA_BIND_PREFIX}{i}": url.strip() for i, url in enumerate(urls.split(",")) if url.strip()}
+
+
+class RoutingSession(Session):
+    """db.session that sends SELECTs from read-only routes to a replica.
+
+    Everything else uses the primary: flushes, raw SQL, writes, reads
+    outside a `read_only` view, reads inside `use_primary()`, and reads
+    from clients still inside their sticky window after a write. Without
+    replica binds configured every statement goes to the primary.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and isinstance(clause, Select) and _reads_from_replica():
+            engine = _replica_engine(self._db)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper, clause, bind, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _remember_write(session, flush_context):
+    if has_request_context():
+        g.db_wrote = True
+
+
+def _reads_from_replica():
+    return has_app_context() and g.get("db_read_only", False) and not g.get("db_use_primary", False)
+
+
+def _replica_engine(db):
+    # One replica per request, so a request never mixes two replicas' lag
+    if "db_replica" not in g:
+        replicas = [engine for key, engine in db.engines.items() if key and key.startswith(REPLICA_BIND_PREFIX)]
+        g.db_replica = random.choice(replicas) if replicas else None
+    return g.db_replica
+
+
+def read_only(view):
+    """Let a view's SELECTs go to a read replica.
+
+    Clients that wrote within the last REPLICA_STICKY_SECONDS, and so send
+    back the PRIMARY_UNTIL_HEADER they were given, keep reading the primary.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.db_read_only = not wants_primary(request.headers)
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def wants_primary(headers):
+    """True while the request echoes an unexpired PRIMARY_UNTIL_HEADER."""
+    try:
+        sticky_until = float(headers.get(PRIMARY_UNTIL_HEADER, 0))
+    except ValueError:
+        sticky_until = 0
+    return sticky_until > time.time()
+
+
+def primary_until(sticky_seconds):
+    """PRIMARY_UNTIL_HEADER value for a response to a write."""
+    return f"{time.time() + sticky_seconds:.3f}"
+
+
+@contextmanager
+def use_primary(enabled=True):
+    """Force reads inside the block to the primary."""
+    previous = g.get("db_use_primary", False)
+    g.db_use_primary = previous or enabled
+    try:
+        yield
+    finally:
+        g.db_use_primary = previous
+
+
+def init_app(app):
+    """Tell clients that wrote to keep their next reads on the primary.
+
+    Cross-origin clients can only read the header when CORS exposes it
+    (see create_app).
+    """
+    @app.after_request
+    def set_primary_until(response):
+        if g.get("db_wrote") and app.config.get("SQLALCHEMY_BINDS"):
+            sticky_seconds = app.config.get("REPLICA_STICKY_SECONDS", 5)
+            response.headers[PRIMARY_UNTIL_HEADER] = primary_until(sticky_seconds)
+        return response
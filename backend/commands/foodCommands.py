@@ -1,7 +1,15 @@
+from commands.cache import LRUCache
+from commands.dbRouting import use_primary
+from commands.menuPayload import MenuPayload
+from config import Config
 from dto.foodItem import FoodItemDTO
 from extensions import db
 from models import FoodItem
 
+# Menu reads are cached per category; every write path must call
+# FoodCommands.invalidate_menu() after committing
+menu_cache = LRUCache(Config.MENU_CACHE_MAX_ENTRIES, Config.MENU_CACHE_TTL_SECONDS)
+
 class FoodCommands:
     @staticmethod
     def add_food_item(name, description, price, image_url, category):
@@ -14,17 +22,51 @@ class FoodCommands:
         )
         db.session.add(new_food)
         db.session.commit()
+        FoodCommands.invalidate_menu()
         return FoodItemDTO(new_food.id, new_food.name, new_food.description, new_food.price, new_food.image_url, new_food.category)
 
     @staticmethod
     def get_all_food_items(category=None):
+        return menu_cache.get_or_load(("items", category or None), lambda: FoodCommands._load_food_items(category))
+
+    @staticmethod
+    def _load_food_items(category=None):
         query = FoodItem.query
         if category:
             query = query.filter(FoodItem.category == category)
-        food_items = query.all()
+        with FoodCommands._fresh_reads():
+            food_items = query.all()
         return [FoodItemDTO(item.id, item.name, item.description, item.price, item.image_url, item.category) for item in food_items]
 
+    @staticmethod
+    def get_menu_payload(category=None):
+        """Serialized GET /menu response, built once per menu version."""
+        return menu_cache.get_or_load(
+            ("payload", category or None),
+            lambda: MenuPayload([item.to_dict() for item in FoodCommands.get_all_food_items(category)])
+        )
+
     @staticmethod
     def get_all_categories():
-        categories = db.session.query(FoodItem.category).distinct().all()
+        return menu_cache.get_or_load(("categories",), FoodCommands._load_categories)
+
+    @staticmethod
+    def _load_categories():
+        with FoodCommands._fresh_reads():
+            categories = db.session.query(FoodItem.category).distinct().all()
         return [category[0] for category in categories]  # Extract category names
+
+    @staticmethod
+    def _fresh_reads():
+        # A fill right after a menu write is kept until the TTL, so it must
+        # not come from a replica that hasn't seen the write yet
+        return use_primary(menu_cache.invalidated_within(Config.REPLICA_STICKY_SECONDS))
+
+    @staticmethod
+    def invalidate_menu():
+        """Drop every cached menu entry; call after any food_items write."""
+        menu_cache.invalidate()
+
+    @staticmethod
+    def get_cache_stats():
+        return menu_cache.stats()
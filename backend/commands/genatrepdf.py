@@ -1,42 +1,151 @@
-import uuid
+import io
 import os
+from functools import lru_cache
 from flask import send_file
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import simpleSplit
-from models import FoodItem  # Ensure FoodItem is imported
+from commands.receiptStorage import new_temp_path, store_receipt_file
 
-# Directory to store generated PDFs
-PDF_DIR = "receipts"
-os.makedirs(PDF_DIR, exist_ok=True)
+def generate_pdf(order, receipt_id, items=None):
+    """Generate a user-friendly PDF for the order receipt with header, address, and footer.
 
-def generate_pdf(order, receipt_id):
-    """Generate a user-friendly PDF for the order receipt with header, address, and footer."""
+    Pass `items` as an iterable of (food_name, quantity) to stream the lines
+    instead of loading `order.order_items`. Returns (storage_key, content_hash).
+    """
     
     # ✅ Use receipt_id as a string instead of converting to bytes
-    pdf_path = os.path.join(PDF_DIR, f"{receipt_id}.pdf")
+    return render_receipt_file(receipt_id, order_snapshot(order, items))
 
-    c = canvas.Canvas(pdf_path, pagesize=letter)
 
-    # 🏷️ Restaurant Name Header
-    restaurant_name = "🍽️ Thank you for ordering from Gourmet Delight!"
-    hotel_address = "📍 123 Foodie Lane, Flavor Town, FT 56789"
-    
-    c.setFont("Helvetica-Bold", 14)
-    c.drawString(120, 780, restaurant_name)
+def order_snapshot(order, items=None):
+    """Plain copy of what a receipt needs from an order and its items.
 
-    c.setFont("Helvetica", 12)
-    c.drawString(160, 760, hotel_address)
+    Picklable for worker processes unless a streaming `items` iterable
+    is supplied.
+    """
+    if items is None:
+        items = [(item.food_name, item.quantity) for item in order.order_items]
+    return {
+        "id": order.id,
+        "total_price": order.total_price,
+        "status": order.status,
+        "items": items
+    }
+
+
+def render_receipt_file(receipt_id, order, use_template=True):
+    """Render `order` (an order_snapshot dict) into content-addressed storage.
+
+    The PDF is written to a local temp file and then handed to the receipt
+    storage backend under its hash-sharded key, or dropped if identical
+    bytes are already stored. Returns (storage_key, content_hash).
+    """
+    tmp_path = render_receipt_temp(receipt_id, order, use_template)
+    try:
+        return store_receipt_file(tmp_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def render_receipt_temp(receipt_id, order, use_template=True):
+    """Render `order` into a new local temp file and return its path; the caller removes it.
+
+    Needs no app context, database or storage backend, so it can run in a
+    worker process while the parent does the storing.
+    """
+    tmp_path = new_temp_path()
+    try:
+        # invariant=1 keeps the PDF byte-identical for identical input, so
+        # re-renders deduplicate
+        _draw_receipt(canvas.Canvas(tmp_path, pagesize=letter, invariant=1), receipt_id, order, use_template)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return tmp_path
+
+
+def render_receipt_bytes(receipt_id, order, use_template=True):
+    """Render `order` (an order_snapshot dict) into memory and return the PDF bytes."""
+    buffer = io.BytesIO()
+    _draw_receipt(canvas.Canvas(buffer, pagesize=letter, invariant=1), receipt_id, order, use_template)
+    return buffer.getvalue()
+
+
+class ReceiptTemplate:
+    """Static parts of every receipt, compiled once per process.
+
+    The header, address, title and footer are drawn once onto a scratch
+    canvas and the resulting PDF operators are kept. Each receipt pastes
+    those operators into its page instead of laying the text out again,
+    so only the order-specific lines are drawn per receipt.
+    """
+
+    def __init__(self):
+        # 🏷️ Restaurant Name Header, 🧾 Title and ✨ Footer Message
+        self.static_text = (
+            ("Helvetica-Bold", 14, 120, 780, "🍽️ Thank you for ordering from Gourmet Delight!"),
+            ("Helvetica", 12, 160, 760, "📍 123 Foodie Lane, Flavor Town, FT 56789"),
+            ("Helvetica-Bold", 16, 220, 730, "Order Receipt"),
+            ("Helvetica-Oblique", 12, 150, 50, "We appreciate your business! Enjoy your meal. 🍽️"),
+        )
+
+        scratch = canvas.Canvas(io.BytesIO(), pagesize=letter)
+        first_op = len(scratch._code)
+        self.draw_static(scratch)
+        self.operators = "\n".join(scratch._code[first_op:])
+        # Operators name fonts by per-document resource names (/F1, /F2...),
+        # including fallback fonts picked for the emoji, so remember the
+        # mapping they were compiled against
+        self.font_resources = dict(scratch._doc.fontMapping)
 
-    # 🧾 Title
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(220, 730, "Order Receipt")
+    def draw_static(self, c):
+        for font_name, size, x, y, text in self.static_text:
+            c.setFont(font_name, size)
+            c.drawString(x, y, text)
+
+    def stamp(self, c):
+        """Paste the precompiled static layer onto the current page of `c`."""
+        resources = {font: c._doc.getInternalFontName(font) for font in self.font_resources}
+        if resources == self.font_resources:
+            c.addLiteral(self.operators)
+        else:
+            # The document registered other fonts first; lay the text out normally
+            self.draw_static(c)
+
+
+RECEIPT_TEMPLATE = ReceiptTemplate()
+
+
+@lru_cache(maxsize=4096)
+def _wrap_item_line(text):
+    # Menu names repeat across receipts, so wrapped lines are memoized
+    return tuple(simpleSplit(text, "Helvetica", 11, 500))
+
+
+# Item lines flow down to just above the footer, then continue on a new page
+ITEM_LINE_HEIGHT = 20
+ITEMS_BOTTOM_MARGIN = 80
+CONTINUED_ITEMS_TOP = 670
+
+
+def _draw_receipt(c, receipt_id, order, use_template=True):
+    """Draw a receipt, paginating as item lines run out of room.
+
+    `order["items"]` may be any iterable of (food_name, quantity), including
+    a generator, and is consumed once; only the current page is laid out
+    at a time.
+    """
+    page_number = 1
+    _start_page(c, use_template)
 
     c.setFont("Helvetica", 12)
     c.drawString(50, 690, f"Receipt ID: {receipt_id}")  # ✅ Use directly
-    c.drawString(50, 670, f"Order ID: {order.id}")
-    c.drawString(50, 650, f"Total Price: ${order.total_price:.2f}")
-    c.drawString(50, 630, f"Status: {order.status}")
+    c.drawString(50, 670, f"Order ID: {order['id']}")
+    c.drawString(50, 650, f"Total Price: ${order['total_price']:.2f}")
+    c.drawString(50, 630, f"Status: {order['status']}")
 
     # Draw a separator line
     c.line(50, 610, 550, 610)
@@ -46,23 +155,36 @@ def generate_pdf(order, receipt_id):
     c.drawString(50, 590, "Order Items:")
     y_position = 570
 
-    for item in order.order_items:
-        food = FoodItem.query.get(item.food_id)  # Fetch the actual food item
-        food_name = food.name if food else "Unknown Food"
+    c.setFont("Helvetica", 11)
+    for food_name, quantity in order["items"]:
+        for line in _wrap_item_line(f"{food_name} (Qty: {quantity})"):  # Wrap text if too long
+            if y_position < ITEMS_BOTTOM_MARGIN:
+                _draw_page_number(c, page_number)
+                c.showPage()
+                page_number += 1
+                _start_page(c, use_template)
+                c.setFont("Helvetica-Bold", 12)
+                c.drawString(50, 690, f"Order Items (continued) - Order ID: {order['id']}")
+                c.setFont("Helvetica", 11)  # showPage resets the font
+                y_position = CONTINUED_ITEMS_TOP
 
-        c.setFont("Helvetica", 11)
-        text = f"{food_name} (Qty: {item.quantity})"
-        lines = simpleSplit(text, "Helvetica", 11, 500)  # Wrap text if too long
-
-        for line in lines:
             c.drawString(50, y_position, line)
-            y_position -= 20  # Move down for the next line
+            y_position -= ITEM_LINE_HEIGHT  # Move down for the next line
 
-    # ✨ Footer Message
-    footer_text = "We appreciate your business! Enjoy your meal. 🍽️"
-    c.setFont("Helvetica-Oblique", 12)
-    c.drawString(150, 50, footer_text)  # Positioning it at the bottom
+    if page_number > 1:
+        _draw_page_number(c, page_number)
 
     # Save the PDF
     c.save()
-    return pdf_path
+
+
+def _start_page(c, use_template):
+    if use_template:
+        RECEIPT_TEMPLATE.stamp(c)
+    else:
+        RECEIPT_TEMPLATE.draw_static(c)
+
+
+def _draw_page_number(c, page_number):
+    c.setFont("Helvetica", 9)
+    c.drawRightString(550, 30, f"Page {page_number}")
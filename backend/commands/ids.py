@@ -0,0 +1,23 @@
+import uuid
+from flask import abort, jsonify, make_response
+
+
+def is_uuid(value):
+    """True when `value` is a UUID string that can be bound to an id column."""
+    try:
+        uuid.UUID(value)
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return True
+
+
+def validate_path_ids(endpoint, values):
+    """Blueprint url_value_preprocessor answering 400 for malformed ids in the URL.
+
+    Every `*_id`/`*_uuid` path value is bound to a UUID column. With
+    BINARY_UUID_KEYS a malformed one fails inside the driver, so it is
+    rejected here before any view runs.
+    """
+    for name, value in (values or {}).items():
+        if name.endswith(("_id", "_uuid")) and not is_uuid(value):
+            abort(make_response(jsonify({"error": "Invalid UUID format"}), 400))
@@ -0,0 +1,283 @@
+import datetime
+import random
+import statistics
+import time
+from decimal import Decimal
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy import (Column, ForeignKey, MetaData, Numeric, String, Table as SqlTable, bindparam,
+                        create_engine, inspect, select, text)
+from sqlalchemy.engine import make_url
+from constants.enums import BookingStatus, OrderStatus
+from extensions import db
+from models import BinaryUUID, FoodItem, Order, OrderItem, Table, TableBooking, User, UUIDType, generate_uuid
+
+indexes_cli = AppGroup("indexes", help="Index maintenance commands.")
+
+INSERT_BATCH_SIZE = 5000
+CATEGORIES = [f"Category {i}" for i in range(20)]
+
+# Share of the seeded rows per table; users come on top, one per 100 rows
+ROW_SHARES = {"food_items": 0.05, "tables": 0.05, "orders": 0.3, "order_items": 0.4, "table_bookings": 0.2}
+
+# (label, index, query). {hint} becomes IGNORE INDEX (...) for the
+# "without" run, so both plans come from the same data
+HOT_QUERIES = [
+    ("orders of a user by status", "ix_orders_user_id_status",
+     "SELECT id FROM orders {hint} WHERE user_id = :user_id AND status = :status"),
+    ("bookings of a user on a date", "ix_table_bookings_user_id_date",
+     "SELECT id FROM table_bookings {hint} WHERE user_id = :booking_user_id AND `date` = :day"),
+    ("booked tables", "ix_tables_is_booked",
+     "SELECT id FROM tables {hint} WHERE is_booked = 1"),
+    ("table by number", "ix_tables_table_number",
+     "SELECT id FROM tables {hint} WHERE table_number = :table_number"),
+    ("menu by category", "ix_food_items_category",
+     "SELECT id FROM food_items {hint} WHERE category = :category"),
+    ("menu item by name", "ix_food_items_name",
+     "SELECT id FROM food_items {hint} WHERE name = :name"),
+    ("items of an order", "ix_order_items_order_id",
+     "SELECT id FROM order_items {hint} WHERE order_id = :order_id"),
+]
+
+# Id column types compared by benchmark-uuid; "char" is the default layout,
+# "binary" the one BINARY_UUID_KEYS switches to
+UUID_LAYOUTS = {"char": lambda: String(36), "binary": BinaryUUID}
+
+
+@indexes_cli.command("benchmark")
+@click.option("--database-url", envvar="INDEX_BENCHMARK_DATABASE_URL", required=True,
+              help="Empty MySQL database to seed; never the app's own. Also read from INDEX_BENCHMARK_DATABASE_URL.")
+@click.option("--rows", type=int, default=1_000_000, show_default=True, help="Rows seeded across the indexed tables.")
+@click.option("--repeat", type=int, default=5, show_default=True, help="Timed runs per query and plan.")
+@click.option("--keep", is_flag=True, help="Leave the seeded tables in place afterwards.")
+def benchmark(database_url, rows, repeat, keep):
+    """Seed a scratch MySQL database and compare hot-query plans and timings without and with their indexes."""
+    engine = _scratch_engine(database_url)
+    try:
+        existing = set(inspect(engine).get_table_names()) & set(db.metadata.tables)
+        if existing:
+            raise click.UsageError(f"The target database already has app tables ({', '.join(sorted(existing))}).")
+
+        db.metadata.create_all(engine)
+        try:
+            started = time.perf_counter()
+            with engine.begin() as connection:
+                params = _seed(connection, rows)
+                connection.execute(text("ANALYZE TABLE orders, table_bookings, tables, food_items, order_items"))
+            click.echo(f"Seeded {rows:,} rows in {time.perf_counter() - started:.1f}s\n")
+
+            with engine.connect() as connection:
+                for label, index, query in HOT_QUERIES:
+                    click.echo(f"{label} ({index})")
+                    for caption, hint in (("without index", f"IGNORE INDEX ({index})"), ("with index", "")):
+                        sql = query.format(hint=hint)
+                        statement = _statement(sql)
+                        plan = connection.execute(_statement(f"EXPLAIN {sql}"), params).mappings().first()
+                        samples = []
+                        for _ in range(repeat):
+                            run_started = time.perf_counter()
+                            connection.execute(statement, params).fetchall()
+                            samples.append(time.perf_counter() - run_started)
+                        click.echo(f"  {caption:>13}: type={plan['type']} key={plan['key']} "
+                                   f"rows~{plan['rows']:,}  median {statistics.median(samples) * 1000:.3f} ms")
+        finally:
+            if not keep:
+                db.metadata.drop_all(engine)
+    finally:
+        engine.dispose()
+
+
+@indexes_cli.command("benchmark-uuid")
+@click.option("--database-url", envvar="INDEX_BENCHMARK_DATABASE_URL", required=True,
+              help="Scratch MySQL database; never the app's own. Also read from INDEX_BENCHMARK_DATABASE_URL.")
+@click.option("--rows", type=int, default=1_000_000, show_default=True,
+              help="Orders inserted per layout, plus one user per 10 orders.")
+@click.option("--lookups", type=int, default=2000, show_default=True, help="Timed primary- and foreign-key lookups per layout.")
+@click.option("--layout", "layouts", type=click.Choice(list(UUID_LAYOUTS)), multiple=True,
+              default=tuple(UUID_LAYOUTS), show_default=True, help="Id layout to benchmark, repeatable.")
+@click.option("--keep", is_flag=True, help="Leave the seeded tables in place afterwards.")
+def benchmark_uuid(database_url, rows, lookups, layouts, keep):
+    """Compare 36-character and BINARY(16) ids: insert throughput, PK/FK lookup latency and table size."""
+    engine = _scratch_engine(database_url)
+    try:
+        for layout in layouts:
+            metadata, users, orders = _uuid_tables(layout)
+            existing = set(inspect(engine).get_table_names()) & set(metadata.tables)
+            if existing:
+                raise click.UsageError(f"The target database already has {', '.join(sorted(existing))}.")
+
+            metadata.create_all(engine)
+            try:
+                started = time.perf_counter()
+                user_ids, order_ids = _seed_uuid_layout(engine, users, orders, rows, lookups)
+                elapsed = time.perf_counter() - started
+                inserted = rows + len(user_ids)
+                with engine.begin() as connection:
+                    connection.execute(text(f"ANALYZE TABLE {users.name}, {orders.name}"))
+
+                click.echo(f"{layout} ({users.c.id.type.compile(engine.dialect)} ids)")
+                click.echo(f"  insert: {inserted:,} rows in {elapsed:.1f}s, {inserted / elapsed:,.0f} rows/s")
+                with engine.connect() as connection:
+                    pk = _lookup_latencies(connection, select(orders.c.total_price).where(orders.c.id == bindparam("id")), order_ids)
+                    fk = _lookup_latencies(connection, select(orders.c.id).where(orders.c.user_id == bindparam("id")), user_ids)
+                    click.echo(f"  PK lookup (order by id): median {pk[0]:.3f} ms, p95 {pk[1]:.3f} ms")
+                    click.echo(f"  FK lookup (orders of a user): median {fk[0]:.3f} ms, p95 {fk[1]:.3f} ms")
+                    sizes = connection.execute(text(
+                        "SELECT table_name AS name, data_length AS data, index_length AS indexes "
+                        "FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name IN :names"
+                    ).bindparams(bindparam("names", expanding=True)), {"names": [users.name, orders.name]}).mappings()
+                    for size in sizes:
+                        click.echo(f"  {size['name']}: data {size['data'] / 2**20:,.1f} MiB, "
+                                   f"indexes {size['indexes'] / 2**20:,.1f} MiB")
+            finally:
+                if not keep:
+                    metadata.drop_all(engine)
+    finally:
+        engine.dispose()
+
+
+def _scratch_engine(database_url):
+    """Engine for the benchmark database, refusing anything but a MySQL database other than the app's."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "mysql":
+        raise click.UsageError("The index benchmark needs a MySQL database URL (mysql+<driver>://...).")
+    if url == make_url(current_app.config["SQLALCHEMY_DATABASE_URI"]):
+        raise click.UsageError("Refusing to seed the app's own database; point --database-url at a scratch one.")
+    return create_engine(url)
+
+
+def _uuid_tables(layout):
+    """(metadata, users, orders): the users/orders key shape with `layout` ids, under benchmark-only names."""
+    metadata = MetaData()
+    id_type = UUID_LAYOUTS[layout]
+    users = SqlTable(f"uuid_benchmark_{layout}_users", metadata,
+                     Column("id", id_type(), primary_key=True),
+                     Column("name", String(100), nullable=False))
+    orders = SqlTable(f"uuid_benchmark_{layout}_orders", metadata,
+                      Column("id", id_type(), primary_key=True),
+                      Column("user_id", id_type(), ForeignKey(users.c.id), nullable=False, index=True),
+                      Column("total_price", Numeric(10, 2), nullable=False))
+    return metadata, users, orders
+
+
+def _seed_uuid_layout(engine, users, orders, rows, lookups):
+    """Insert the users and `rows` orders, committing every batch as the app would.
+
+    Returns about `lookups` user ids and order ids spread over the data,
+    to look up afterwards.
+    """
+    rng = random.Random(0)
+    user_ids = [generate_uuid() for _ in range(max(rows // 10, 1))]
+    every = max(rows // lookups, 1)
+    order_ids = []
+
+    def order_rows():
+        for i in range(rows):
+            order_id = generate_uuid()
+            if i % every == 0:
+                order_ids.append(order_id)
+            yield {"id": order_id, "user_id": rng.choice(user_ids), "total_price": Decimal(rng.randint(100, 9999)) / 100}
+
+    for table, batch_rows in ((users, ({"id": user_id, "name": f"User {i}"} for i, user_id in enumerate(user_ids))),
+                              (orders, order_rows())):
+        batch = []
+        for row in batch_rows:
+            batch.append(row)
+            if len(batch) >= INSERT_BATCH_SIZE:
+                with engine.begin() as connection:
+                    connection.execute(table.insert(), batch)
+                batch = []
+        if batch:
+            with engine.begin() as connection:
+                connection.execute(table.insert(), batch)
+
+    return rng.sample(user_ids, min(lookups, len(user_ids))), order_ids[:lookups]
+
+
+def _lookup_latencies(connection, statement, ids):
+    """(median, p95) milliseconds of running `statement` once per id."""
+    samples = []
+    for value in ids:
+        started = time.perf_counter()
+        connection.execute(statement, {"id": value}).fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+    if len(samples) < 2:
+        return samples[0], samples[0]
+    return statistics.median(samples), statistics.quantiles(samples, n=20)[18]
+
+
+def _seed(connection, rows):
+    """Insert `rows` synthetic rows; returns lookup values for HOT_QUERIES."""
+    rng = random.Random(0)
+    counts = {name: max(int(rows * share), 1) for name, share in ROW_SHARES.items()}
+
+    user_ids = [generate_uuid() for _ in range(max(rows // 100, 1))]
+    _insert(connection, User, ({
+        "id": user_id, "name": f"User {i}", "email": f"user{i}@example.com", "password": "x", "role": "user"
+    } for i, user_id in enumerate(user_ids)))
+
+    foods = [(generate_uuid(), f"Dish {i}", Decimal(rng.randint(100, 5000)) / 100) for i in range(counts["food_items"])]
+    _insert(connection, FoodItem, ({
+        "id": food_id, "name": name, "description": "Seeded dish", "price": price,
+        "image_url": None, "category": rng.choice(CATEGORIES)
+    } for food_id, name, price in foods))
+
+    # About 1% of tables booked, so is_booked = 1 is selective
+    _insert(connection, Table, ({
+        "id": generate_uuid(), "table_number": number, "booking_status": BookingStatus.AVAILABLE,
+        "is_booked": rng.random() < 0.01, "capacity": rng.choice((2, 4, 6))
+    } for number in range(1, counts["tables"] + 1)))
+
+    order_ids = [generate_uuid() for _ in range(counts["orders"])]
+    statuses = [status.value for status in OrderStatus]
+    _insert(connection, Order, ({
+        "id": order_id, "user_id": rng.choice(user_ids), "total_price": Decimal("0.00"), "status": rng.choice(statuses)
+    } for order_id in order_ids))
+
+    def order_items():
+        for _ in range(counts["order_items"]):
+            food_id, name, price = rng.choice(foods)
+            yield {
+                "id": generate_uuid(), "order_id": rng.choice(order_ids), "food_id": food_id,
+                "quantity": rng.randint(1, 4), "food_name": name, "unit_price": price
+            }
+    _insert(connection, OrderItem, order_items())
+
+    first_day = datetime.date(2025, 1, 1)
+    bookings = [(rng.choice(user_ids), first_day + datetime.timedelta(days=rng.randrange(365)))
+                for _ in range(counts["table_bookings"])]
+    _insert(connection, TableBooking, ({
+        "id": generate_uuid(), "user_id": user_id, "date": day,
+        "time": datetime.time(rng.randrange(17, 23), rng.choice((0, 15, 30, 45))),
+        "status": "Pending", "duration_minutes": 90, "party_size": rng.randint(1, 8)
+    } for user_id, day in bookings))
+
+    # The order lookups use user_ids[0]; the booking lookup one of its bookings
+    booking_user_id, booking_day = bookings[len(bookings) // 2]
+    return {
+        "user_id": user_ids[0], "status": OrderStatus.PENDING.value,
+        "booking_user_id": booking_user_id, "day": booking_day,
+        "table_number": counts["tables"] // 2, "category": CATEGORIES[0],
+        "name": foods[len(foods) // 2][1], "order_id": order_ids[len(order_ids) // 2],
+    }
+
+
+def _statement(sql):
+    # Ids bind through the column type, so BINARY_UUID_KEYS layouts match too
+    statement = text(sql)
+    for name in ("user_id", "booking_user_id", "order_id"):
+        if f":{name}" in sql:
+            statement = statement.bindparams(bindparam(name, type_=UUIDType))
+    return statement
+
+
+def _insert(connection, model, rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            connection.execute(model.__table__.insert(), batch)
+            batch = []
+    if batch:
+        connection.execute(model.__table__.insert(), batch)
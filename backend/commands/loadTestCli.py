@@ -0,0 +1,74 @@
+import http.client
+import itertools
+import statistics
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+import click
+from flask.cli import AppGroup
+
+loadtest_cli = AppGroup("loadtest", help="HTTP load testing against a running server.")
+
+DEFAULT_PATHS = ("/menu/", "/orders/?limit=50", "/tables/")
+
+
+@loadtest_cli.command("run")
+@click.option("--url", default="http://127.0.0.1:5000", show_default=True,
+              help="Base URL of the server under test (flask run, gunicorn wsgi:app, uvicorn asgi:app, ...).")
+@click.option("--path", "paths", multiple=True, default=DEFAULT_PATHS, show_default=True,
+              help="GET path to request, repeatable; requests cycle through them.")
+@click.option("--requests", "total", type=int, default=2000, show_default=True, help="Requests to send in total.")
+@click.option("--concurrency", type=int, default=16, show_default=True, help="Client threads, each on its own keep-alive connection.")
+@click.option("--timeout", type=float, default=10.0, show_default=True, help="Per-request timeout in seconds.")
+def run(url, paths, total, concurrency, timeout):
+    """Send GET requests from concurrent clients and report requests/s and latency percentiles."""
+    target = urlsplit(url)
+    if target.scheme not in ("http", "https"):
+        raise click.UsageError("--url must be an http:// or https:// URL")
+    connection_class = http.client.HTTPSConnection if target.scheme == "https" else http.client.HTTPConnection
+    prefix = target.path.rstrip("/")
+
+    tickets = itertools.count()
+    latencies, statuses, errors = [], Counter(), Counter()
+    lock = threading.Lock()
+
+    def client():
+        connection = connection_class(target.hostname, target.port, timeout=timeout)
+        try:
+            while (i := next(tickets)) < total:
+                path = prefix + paths[i % len(paths)]
+                started = time.perf_counter()
+                try:
+                    connection.request("GET", path, headers={"Connection": "keep-alive"})
+                    response = connection.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException) as e:
+                    connection.close()  # Reconnects on the next request
+                    with lock:
+                        errors[type(e).__name__] += 1
+                    continue
+                elapsed = time.perf_counter() - started
+                with lock:
+                    latencies.append(elapsed)
+                    statuses[response.status] += 1
+        finally:
+            connection.close()
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    click.echo(f"{len(latencies)} responses, {sum(errors.values())} errors in {elapsed:.2f}s "
+               f"with {concurrency} clients: {len(latencies) / elapsed if elapsed else 0.0:.1f} requests/s")
+    if latencies:
+        cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        click.echo(f"latency: p50 {cuts[49] * 1000:.2f} ms, p95 {cuts[94] * 1000:.2f} ms, "
+                   f"p99 {cuts[98] * 1000:.2f} ms, max {max(latencies) * 1000:.2f} ms")
+    click.echo("status codes: " + ", ".join(f"{status} x{count}" for status, count in sorted(statuses.items())))
+    if errors:
+        click.echo("errors: " + ", ".join(f"{name} x{count}" for name, count in errors.most_common()), err=True)
@@ -0,0 +1,51 @@
+import gzip
+import hashlib
+from flask import Response, current_app
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+
+class MenuPayload:
+    """A menu response serialized once, with a strong ETag and compressed variants.
+
+    Built once per menu cache version and then shared by every request, so
+    the hot path never re-serializes or re-compresses the menu.
+    """
+
+    def __init__(self, data, dumps=None):
+        # The async app passes its own app.json.dumps; the output is the same
+        dumps = dumps or current_app.json.dumps
+        self.body = (dumps(data) + "\n").encode("utf-8")
+        self.etag = hashlib.sha256(self.body).hexdigest()[:32]
+        # A strong ETag identifies exact bytes, so each encoding gets its own
+        self.variants = {None: (self.body, self.etag)}
+        self.variants["gzip"] = (gzip.compress(self.body, mtime=0), f"{self.etag}-gzip")
+        if brotli is not None:
+            self.variants["br"] = (brotli.compress(self.body), f"{self.etag}-br")
+
+    def _pick_encoding(self, request):
+        best, best_quality = None, 0
+        for encoding in ("br", "gzip"):
+            quality = request.accept_encodings[encoding]
+            if encoding in self.variants and quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def make_response(self, request, response_class=Response):
+        encoding = self._pick_encoding(request)
+        body, etag = self.variants[encoding]
+
+        if request.if_none_match.contains(etag):
+            response = response_class(status=304)
+        else:
+            response = response_class(body, mimetype="application/json")
+            if encoding:
+                response.headers["Content-Encoding"] = encoding
+
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        response.vary.add("Accept-Encoding")
+        return response
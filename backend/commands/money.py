@@ -0,0 +1,34 @@
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+
+# Prices and totals are stored as NUMERIC(10, 2): exact cents, so sums in
+# SQL and in Python never pick up binary floating point error
+MONEY_PRECISION = 10
+MONEY_SCALE = 2
+CENT = Decimal("0.01")
+
+
+def parse_money(value):
+    """Client input (number or string) -> Decimal rounded to whole cents.
+
+    Goes through str() so a JSON float like 9.99 becomes Decimal("9.99"),
+    not 9.9900000000000002131... Raises ValueError for anything that is not
+    a non-negative amount.
+    """
+    try:
+        amount = Decimal(str(value)).quantize(CENT, rounding=ROUND_HALF_UP)
+    except (InvalidOperation, ValueError):
+        raise ValueError("price must be a number")
+    if not amount.is_finite() or amount < 0:
+        raise ValueError("price must be a non-negative number")
+    return amount
+
+
+def money_to_json(value):
+    """Decimal amount -> JSON number, as every DTO exposes money.
+
+    A two-decimal amount survives the float conversion exactly as far as
+    JSON is concerned: it serializes back to the same digits.
+    """
+    if value is None:
+        return None
+    return float(Decimal(value).quantize(CENT, rounding=ROUND_HALF_UP))
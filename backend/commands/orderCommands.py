@@ -1,11 +1,20 @@
 import os
-import uuid
+import hashlib
 import traceback
-from flask import jsonify, send_file
-from commands.genatrepdf import generate_pdf
-from constants.enums import OrderStatus
+from datetime import datetime, timezone
+from decimal import Decimal
+from flask import Response, jsonify, send_file, url_for
+from sqlalchemy import func
+from sqlalchemy.orm import selectinload
+from commands.money import money_to_json
+from commands.pagination import iter_pages, paginate, page_response
+from commands.genatrepdf import order_snapshot, render_receipt_bytes
+from commands.receiptQueue import enqueue_receipt, receipt_cache
+from commands.receiptStorage import get_storage
+from commands.streaming import stream_records
+from constants.enums import OrderStatus, ReceiptStatus
 from extensions import db
-from models import FoodItem, Order, OrderItem, Receipt
+from models import FoodItem, Order, OrderItem, Receipt, generate_uuid
 
 
 class OrderCommands:
@@ -18,44 +27,49 @@ class OrderCommands:
         if not user_id or not order_items:
             return jsonify({"error": "Missing required fields"}), 400
 
-        # Create order with string UUID
+        error = OrderCommands.validate_order_items(order_items)
+        if error:
+            return jsonify({"error": error}), 400
+
+        # Resolve every requested name in one IN (...) query
+        names = {item["name"] for item in order_items}
+        foods_by_name = {}
+        for food in FoodItem.query.filter(FoodItem.name.in_(names)).all():
+            foods_by_name.setdefault(food.name, food)
+
+        missing = sorted(names - foods_by_name.keys())
+        if missing:
+            return jsonify({
+                "error": f"Food items not found: {', '.join(missing)}",
+                "missing": missing
+            }), 404
+
+        # Create order with string UUID; prices come from the menu, never the client
         new_order = Order(
-            id=str(uuid.uuid4()),
+            id=generate_uuid(),
             user_id=user_id,
-            total_price=sum(item["price"] * item["quantity"] for item in order_items),
             status=OrderStatus.PENDING.value
         )
         db.session.add(new_order)
 
         for item in order_items:
-            food = FoodItem.query.filter_by(name=item["name"]).first()
-            if not food:
-                return jsonify({"error": f"Food item '{item['name']}' not found"}), 404
-            
-            order_item = OrderItem(
+            food = foods_by_name[item["name"]]
+            new_order.order_items.append(OrderItem(
                 order_id=new_order.id,
-                food_id=food.id,
+                food=food,
+                food_name=food.name,
+                unit_price=food.price,
                 quantity=item["quantity"]
-            )
-            db.session.add(order_item)
+            ))
+
+        # Decimal arithmetic, so the total is exact to the cent
+        new_order.total_price = sum((item.unit_price * item.quantity for item in new_order.order_items), Decimal("0.00"))
 
+        # Serialize from the rows already in memory before commit expires them
+        response = OrderCommands.order_to_dict(new_order)
         db.session.commit()
 
-        return jsonify({
-            "id": new_order.id,
-            "user_id": new_order.user_id,
-            "total_price": new_order.total_price,
-            "status": new_order.status,
-            "order_items": [
-                {
-                    "name": food.name,
-                    "price": food.price,
-                    "quantity": item.quantity
-                }
-                for item in new_order.order_items
-                for food in [FoodItem.query.get(item.food_id)]
-            ]
-        }), 201
+        return jsonify(response), 201
 
     # 🟠 Update Order Status
     @staticmethod
@@ -69,6 +83,7 @@ class OrderCommands:
 
         order.status = status
         db.session.commit()
+        receipt_cache.invalidate(order_id)  # The receipt shows the status
 
         return jsonify({"message": "Order status updated successfully", "status": order.status})
 
@@ -83,72 +98,217 @@ class OrderCommands:
             if order.status != OrderStatus.PENDING.value:
                 return jsonify({"error": "Order is not in pending state"}), 400
 
-            # Update status and generate receipt
+            # Mark the order sent and queue its receipt in a single commit;
+            # the PDF is rendered off the request thread
             order.status = OrderStatus.SENT.value
+            receipt_id = generate_uuid()
+            db.session.add(Receipt(
+                id=receipt_id,
+                order_id=order.id,
+                status=ReceiptStatus.PENDING.value
+            ))
             db.session.commit()
 
-            receipt_id = str(uuid.uuid4())
-            pdf_path = generate_pdf(order, receipt_id)
+            enqueue_receipt(receipt_id)
 
-            receipt = Receipt(order_id=order.id, file_path=pdf_path)
-            db.session.add(receipt)
-            db.session.commit()
-
-            return jsonify({"message": "Order sent successfully", "receipt_pdf": pdf_path}), 200
+            return jsonify({
+                "message": "Order sent successfully",
+                "receipt_id": receipt_id,
+                "receipt_status": ReceiptStatus.PENDING.value,
+                "status_url": url_for("order_bp.get_receipt_status", receipt_id=receipt_id)
+            }), 202
 
         except Exception as e:
             print("Error Traceback:", traceback.format_exc())
             return jsonify({"error": str(e)}), 500
 
-    # 📥 Download Receipt by Order ID (Now returning order info instead of PDF)
+    # 🧾 Receipt Job Status
+    @staticmethod
+    def get_receipt_status(receipt_id):
+        receipt = Receipt.query.get(receipt_id)
+        if not receipt:
+            return jsonify({"error": "Receipt not found"}), 404
+
+        return jsonify({
+            "receipt_id": receipt.id,
+            "order_id": receipt.order_id,
+            "status": receipt.status,
+            "receipt_pdf": receipt.file_path,
+            "created_at": receipt.created_at.isoformat() if receipt.created_at else None
+        }), 200
+
+    # 📥 Download Receipt by Order ID
     @staticmethod
-    def download_receipt_by_order_id(order_id):
+    def download_receipt_by_order_id(order_id, request):
+        """Serve the receipt PDF, honouring conditional and range requests.
+
+        Repeated downloads are answered from receipt_cache once one indexed
+        query confirms the order's status and latest receipt haven't changed
+        since, which also catches writes made by other worker processes. On a
+        miss the latest rendered file is used; if there is none yet (or it
+        was lost) the receipt is rendered in memory instead.
+        """
         try:
-            order = Order.query.filter_by(id=order_id).first()
-            if not order:
+            fingerprint = OrderCommands._receipt_fingerprint(order_id)
+            if fingerprint is None:
                 return jsonify({"error": "Order not found"}), 404
 
-            # Return order information instead of PDF
-            receipt_info = {
-                "receipt_id": str(uuid.uuid4()),  # Generate receipt ID dynamically
-                "order_id": order.id,
-                "total_price": order.total_price,
-                "status": order.status,
-                "items": [
-                    {
-                        "name": FoodItem.query.get(item.food_id).name,
-                        "quantity": item.quantity,
-                        "price": FoodItem.query.get(item.food_id).price
-                    }
-                    for item in order.order_items
-                ]
-            }
-            return jsonify(receipt_info), 200
+            cached = receipt_cache.get(order_id)
+            if cached is None or cached["fingerprint"] != fingerprint:
+                checkpoint = receipt_cache.checkpoint()
+                cached = OrderCommands._load_receipt(order_id)
+                if cached is None:
+                    return jsonify({"error": "Order not found"}), 404
+                # Stamped with the state read before loading: a change in
+                # between only makes the next download load again
+                cached["fingerprint"] = fingerprint
+                receipt_cache.set(order_id, cached, checkpoint)
+
+            download_name = f"receipt-{order_id}.pdf"
+            if "path" in cached:
+                if os.path.exists(cached["path"]):
+                    return send_file(os.path.abspath(cached["path"]), mimetype="application/pdf",
+                                     download_name=download_name, conditional=True)
+                # The file disappeared under us; load it again
+                receipt_cache.invalidate(order_id)
+                return OrderCommands.download_receipt_by_order_id(order_id, request)
+
+            response = Response(cached["data"], mimetype="application/pdf")
+            response.headers["Content-Disposition"] = f"inline; filename={download_name}"
+            response.set_etag(cached["etag"])
+            response.last_modified = cached["last_modified"]
+            return response.make_conditional(request, accept_ranges=True, complete_length=len(cached["data"]))
 
         except Exception as e:
             print("Error downloading receipt:", e)
             return jsonify({"error": "Receipt not found"}), 404
 
+    @staticmethod
+    def _receipt_fingerprint(order_id):
+        """(order status, latest receipt id, status, content hash), or None when there is no such order"""
+        row = (
+            db.session.query(Order.status, Receipt.id, Receipt.status, Receipt.content_hash)
+            .outerjoin(Receipt, Receipt.order_id == Order.id)
+            .filter(Order.id == order_id)
+            .order_by(Receipt.created_at.desc())
+            .first()
+        )
+        return tuple(row) if row else None
+
+    @staticmethod
+    def _load_receipt(order_id):
+        receipt = Receipt.query.filter_by(order_id=order_id).order_by(Receipt.created_at.desc()).first()
+        if receipt and receipt.status == ReceiptStatus.READY.value and receipt.file_path:
+            storage = get_storage()
+            local_path = storage.local_path(receipt.file_path)
+            if local_path:
+                return {"path": local_path}
+            if storage.exists(receipt.file_path):
+                data = storage.read(receipt.file_path)
+                return {
+                    "data": data,
+                    "etag": (receipt.content_hash or hashlib.sha256(data).hexdigest())[:32],
+                    "last_modified": receipt.created_at.replace(tzinfo=timezone.utc) if receipt.created_at
+                    else datetime.now(timezone.utc)
+                }
+
+        order = Order.query.options(selectinload(Order.order_items)).filter_by(id=order_id).first()
+        if not order:
+            return None
+
+        # Not rendered yet (or the object was lost): render into memory.
+        # Unsent orders have no receipt row, so the order id labels the preview.
+        data = render_receipt_bytes(receipt.id if receipt else order.id, order_snapshot(order))
+        return {
+            "data": data,
+            "etag": hashlib.sha256(data).hexdigest()[:32],
+            "last_modified": datetime.now(timezone.utc)
+        }
+
     # 📝 Get All Orders
     @staticmethod
-    def get_all_orders():
-        orders = Order.query.all()
-
-        return jsonify([
-            {
-                "id": order.id,
-                "user_id": order.user_id,
-                "total_price": order.total_price,
-                "status": order.status,
-                "order_items": [
-                    {
-                        "name": food.name,
-                        "price": food.price,
-                        "quantity": item.quantity
-                    }
-                    for item in order.order_items
-                    for food in [FoodItem.query.get(item.food_id)]
-                ]
-            }
-            for order in orders
-        ])
+    def get_all_orders(page=None):
+        # Orders and their items are loaded in two queries total, no matter
+        # how many orders there are
+        query = Order.query.options(selectinload(Order.order_items))
+
+        if page is None:
+            return jsonify([OrderCommands.order_to_dict(order) for order in query.all()])
+
+        limit, after = page
+        orders, next_cursor = paginate(query, Order.id, limit, after)
+        return jsonify(page_response([OrderCommands.order_to_dict(order) for order in orders], next_cursor))
+
+    # 📦 Export All Orders
+    @staticmethod
+    def export_orders(fmt="ndjson"):
+        query = Order.query.options(selectinload(Order.order_items))
+        orders = (OrderCommands.order_to_dict(order) for order in iter_pages(query, Order.id))
+        return stream_records(orders, fmt, filename="orders")
+
+    # 💰 Revenue Summary
+    @staticmethod
+    def get_revenue(status=None):
+        """Revenue totals, summed by the database over exact NUMERIC columns."""
+        orders = db.session.query(
+            Order.status,
+            func.count(Order.id),
+            func.sum(Order.total_price)
+        )
+        items = db.session.query(
+            OrderItem.food_name,
+            func.sum(OrderItem.quantity),
+            func.sum(OrderItem.unit_price * OrderItem.quantity)
+        ).join(Order, Order.id == OrderItem.order_id)
+
+        if status:
+            orders = orders.filter(Order.status == status)
+            items = items.filter(Order.status == status)
+
+        status_rows = orders.group_by(Order.status).order_by(Order.status).all()
+        item_rows = items.group_by(OrderItem.food_name).order_by(OrderItem.food_name).all()
+
+        return jsonify({
+            "total_revenue": money_to_json(sum((Decimal(revenue) for _, _, revenue in status_rows), Decimal("0.00"))),
+            "order_count": sum(count for _, count, _ in status_rows),
+            "by_status": [
+                {"status": row_status, "orders": count, "revenue": money_to_json(revenue)}
+                for row_status, count, revenue in status_rows
+            ],
+            "by_item": [
+                {"name": name, "quantity": int(quantity), "revenue": money_to_json(revenue)}
+                for name, quantity, revenue in item_rows
+            ]
+        })
+
+    @staticmethod
+    def validate_order_items(order_items):
+        """Error message for a malformed order_items list, or None when every line is usable."""
+        if not isinstance(order_items, list):
+            return "order_items must be a list"
+        for item in order_items:
+            if not isinstance(item, dict) or not isinstance(item.get("name"), str) or not item["name"]:
+                return "Each order item needs a name"
+            quantity = item.get("quantity")
+            # bool is an int subclass; "2" and 1.5 are rejected rather than coerced
+            if isinstance(quantity, bool) or not isinstance(quantity, int) or quantity < 1:
+                return "Each order item needs a quantity that is a positive whole number"
+        return None
+
+    @staticmethod
+    def order_to_dict(order):
+        """Serialize an order whose items are already loaded."""
+        return {
+            "id": order.id,
+            "user_id": order.user_id,
+            "total_price": money_to_json(order.total_price),
+            "status": order.status,
+            "order_items": [
+                {
+                    "name": item.food_name,
+                    "price": money_to_json(item.unit_price),
+                    "quantity": item.quantity
+                }
+                for item in order.order_items
+            ]
+        }
@@ -0,0 +1,78 @@
+from commands.ids import is_uuid
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+EXPORT_BATCH_SIZE = 500
+
+
+def parse_page_args(args):
+    """Read `limit` and `after` from the query string.
+
+    Returns None when neither is given so callers can keep serving the
+    legacy un-paginated list. Raises ValueError on a bad `limit` or an
+    `after` that isn't an id (every listing pages on its UUID key).
+    """
+    if "limit" not in args and "after" not in args:
+        return None
+
+    try:
+        limit = int(args.get("limit", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ValueError("limit must be a positive integer")
+    if limit < 1:
+        raise ValueError("limit must be a positive integer")
+
+    after = args.get("after") or None
+    if after is not None and not is_uuid(after):
+        raise ValueError("after must be a cursor returned by a previous page")
+
+    return min(limit, MAX_PAGE_SIZE), after
+
+
+def paginate(query, key_column, limit, after=None):
+    """Keyset-paginate `query` on a unique, stable `key_column`.
+
+    Rows strictly after the `after` cursor are fetched in key order, one more
+    than requested so we know whether another page exists. Returns
+    (rows, next_cursor); next_cursor is None on the last page.
+    """
+    if after:
+        query = query.filter(key_column > after)
+
+    rows = query.order_by(key_column).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, getattr(rows[-1], key_column.key)
+
+
+async def paginate_async(session, statement, key_column, limit, after=None):
+    """`paginate` for a select() run on an AsyncSession."""
+    if after:
+        statement = statement.where(key_column > after)
+
+    rows = (await session.scalars(statement.order_by(key_column).limit(limit + 1))).all()
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, getattr(rows[-1], key_column.key)
+
+
+def page_response(items, next_cursor):
+    return {"items": items, "next_cursor": next_cursor}
+
+
+def iter_pages(query, key_column, batch_size=EXPORT_BATCH_SIZE):
+    """Yield every row of `query` in key order, one keyset batch at a time.
+
+    Only one batch is held in memory and each batch is a short, independent
+    query, so no server-side cursor stays open while a slow client reads.
+    """
+    after = None
+    while True:
+        rows, after = paginate(query, key_column, batch_size, after)
+        yield from rows
+        if after is None:
+            return
@@ -0,0 +1,103 @@
+import os
+import statistics
+import time
+import click
+from concurrent.futures import ProcessPoolExecutor
+from flask.cli import AppGroup
+from sqlalchemy.orm import selectinload
+from commands.genatrepdf import order_snapshot, render_receipt_bytes, render_receipt_temp
+from commands.pagination import paginate
+from commands.receiptStorage import get_storage, store_receipt_file
+from constants.enums import ReceiptStatus
+from extensions import db
+from models import Order, Receipt
+
+receipts_cli = AppGroup("receipts", help="Receipt maintenance commands.")
+
+
+def _render_job(job):
+    """Process-pool entry point: (receipt_id, order snapshot) -> temp PDF path.
+
+    Workers only render. Storing happens in the parent: a storage backend
+    inherited across fork is a copy (the in-memory store) or a client that
+    must not be shared between processes (boto3).
+    """
+    receipt_id, order = job
+    return render_receipt_temp(receipt_id, order)
+
+
+@receipts_cli.command("rebuild")
+@click.option("--workers", type=int, default=None, help="Renderer processes (default: all cores).")
+@click.option("--batch-size", type=int, default=500, show_default=True, help="Receipts loaded per query.")
+@click.option("--missing-only", is_flag=True, help="Only re-render receipts whose PDF is missing.")
+def rebuild(workers, batch_size, missing_only):
+    """Re-render every stored receipt into the configured receipt storage."""
+    workers = workers or os.cpu_count() or 1
+    query = Receipt.query.options(selectinload(Receipt.order).selectinload(Order.order_items))
+
+    rendered = failed = 0
+    started = time.perf_counter()
+    after = None
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            # Each batch is three queries: receipts, their orders, the orders' items
+            receipts, after = paginate(query, Receipt.id, batch_size, after)
+            jobs = []
+            storage = get_storage()
+            for receipt in receipts:
+                if missing_only and receipt.file_path and storage.exists(receipt.file_path):
+                    continue
+                jobs.append((receipt.id, order_snapshot(receipt.order)))
+
+            futures = {job[0]: pool.submit(_render_job, job) for job in jobs}
+            by_id = {receipt.id: receipt for receipt in receipts}
+            for receipt_id, future in futures.items():
+                receipt = by_id[receipt_id]
+                tmp_path = None
+                try:
+                    tmp_path = future.result()
+                    receipt.file_path, receipt.content_hash = store_receipt_file(tmp_path)
+                    receipt.status = ReceiptStatus.READY.value
+                    rendered += 1
+                except Exception as e:
+                    click.echo(f"Failed to render receipt {receipt_id}: {e}", err=True)
+                    receipt.status = ReceiptStatus.FAILED.value
+                    failed += 1
+                finally:
+                    if tmp_path and os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+            db.session.commit()
+
+            if after is None:
+                break
+
+    elapsed = time.perf_counter() - started
+    rate = rendered / elapsed if elapsed else 0.0
+    click.echo(f"Rendered {rendered} receipts ({failed} failed) in {elapsed:.2f}s "
+               f"with {workers} workers: {rate:.1f} receipts/s")
+
+
+@receipts_cli.command("benchmark")
+@click.option("--count", type=int, default=500, show_default=True, help="Receipts rendered per mode.")
+@click.option("--items", type=int, default=10, show_default=True, help="Order lines per receipt.")
+def benchmark(count, items):
+    """Compare per-receipt render time with and without the cached page template."""
+    order = {
+        "id": "benchmark-order",
+        "total_price": 12.5 * items,
+        "status": "Sent",
+        "items": [(f"Dish {i % 25}", i % 4 + 1) for i in range(items)],
+    }
+    timings = {False: [], True: []}
+    # Interleave the two modes so machine noise hits both equally
+    for i in range(count):
+        for use_template in (False, True):
+            started = time.perf_counter()
+            render_receipt_bytes(f"benchmark-{i}", order, use_template)
+            timings[use_template].append(time.perf_counter() - started)
+
+    for use_template, label in ((False, "without template"), (True, "with template")):
+        samples = timings[use_template]
+        click.echo(f"{label:>16}: median {statistics.median(samples) * 1000:.3f} ms, "
+                   f"mean {statistics.fmean(samples) * 1000:.3f} ms per receipt")
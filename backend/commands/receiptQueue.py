@@ -0,0 +1,77 @@
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from commands.cache import LRUCache
+from commands.genatrepdf import generate_pdf
+from config import Config
+from constants.enums import ReceiptStatus
+from extensions import db
+from models import Order, OrderItem, Receipt
+
+# Order id -> what GET /orders/<id>/receipt serves (a stored file path or
+# in-memory PDF bytes); dropped whenever that order's receipt changes
+receipt_cache = LRUCache(Config.RECEIPT_CACHE_MAX_ENTRIES, Config.RECEIPT_CACHE_TTL_SECONDS)
+
+# One pool per worker process, created on first use so forked servers
+# don't inherit threads from the parent
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(max_workers):
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="receipt")
+        return _executor
+
+
+def enqueue_receipt(receipt_id):
+    """Queue a committed, pending Receipt row for rendering.
+
+    In "thread" mode the PDF is rendered by a background pool and the
+    caller returns immediately; "sync" mode renders inline, which is handy
+    for scripts and local debugging.
+    """
+    app = current_app._get_current_object()
+    if app.config.get("RECEIPT_QUEUE_MODE", "thread") == "sync":
+        render_receipt(app, receipt_id)
+        return None
+
+    executor = _get_executor(app.config.get("RECEIPT_WORKERS", 4))
+    return executor.submit(render_receipt, app, receipt_id)
+
+
+def _stream_items(order_id, batch_size=500):
+    """Yield (food_name, quantity) rows for an order without loading them all."""
+    query = (
+        db.session.query(OrderItem.food_name, OrderItem.quantity)
+        .filter(OrderItem.order_id == order_id)
+        .order_by(OrderItem.id)
+        .yield_per(batch_size)
+    )
+    for food_name, quantity in query:
+        yield food_name, quantity
+
+
+def render_receipt(app, receipt_id):
+    """Render one receipt and record the outcome on its Receipt row."""
+    with app.app_context():
+        receipt = Receipt.query.get(receipt_id)
+        if receipt is None:
+            print(f"Receipt {receipt_id} vanished before it could be rendered")
+            return
+
+        try:
+            order = Order.query.filter_by(id=receipt.order_id).one()
+            receipt.file_path, receipt.content_hash = generate_pdf(order, receipt.id, _stream_items(order.id))
+            receipt.status = ReceiptStatus.READY.value
+        except Exception:
+            print("Error rendering receipt:", traceback.format_exc())
+            db.session.rollback()
+            receipt = Receipt.query.get(receipt_id)
+            receipt.status = ReceiptStatus.FAILED.value
+
+        db.session.commit()
+        receipt_cache.invalidate(receipt.order_id)
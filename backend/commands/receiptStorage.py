@@ -0,0 +1,239 @@
+import hashlib
+import io
+import os
+import threading
+import uuid
+from config import Config
+
+# Local directory for receipts (filesystem backend) and render scratch files
+PDF_DIR = "receipts"
+TMP_DIR = os.path.join(PDF_DIR, ".tmp")
+os.makedirs(TMP_DIR, exist_ok=True)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def new_temp_path():
+    """A unique local scratch path to render into before storing."""
+    return os.path.join(TMP_DIR, f"{uuid.uuid4().hex}.pdf.tmp")
+
+
+def receipt_key(content_hash):
+    """Content-addressed storage key: ab/cd/abcd....pdf"""
+    return f"{content_hash[:2]}/{content_hash[2:4]}/{content_hash}.pdf"
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def store_receipt_file(tmp_path):
+    """Hand a fully written temp file to the configured storage backend.
+
+    Returns (key, content_hash). When identical bytes are already stored
+    nothing is written, so re-renders cost no extra storage.
+    """
+    content_hash = file_digest(tmp_path)
+    key = receipt_key(content_hash)
+    storage = get_storage()
+    if not storage.exists(key):
+        storage.put_file(key, tmp_path)
+    return key, content_hash
+
+
+class FilesystemStorage:
+    """Receipts in sharded directories under `root` on local disk."""
+
+    def __init__(self, root=PDF_DIR):
+        self.root = root
+
+    def local_path(self, key):
+        path = os.path.join(self.root, *key.split("/"))
+        return path if os.path.exists(path) else None
+
+    def exists(self, key):
+        return self.local_path(key) is not None
+
+    def put_file(self, key, src_path):
+        # Same filesystem as TMP_DIR, so the rename is atomic
+        path = os.path.join(self.root, *key.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(src_path, path)
+
+    def open(self, key):
+        return open(os.path.join(self.root, *key.split("/")), "rb")
+
+    def read(self, key):
+        with self.open(key) as f:
+            return f.read()
+
+    def delete(self, key):
+        path = self.local_path(key)
+        if path:
+            os.remove(path)
+
+
+class S3Storage:
+    """Receipts in an S3-compatible bucket (AWS S3, MinIO, ...).
+
+    `client` is a boto3 S3 client or anything with the same methods, such
+    as InMemoryObjectStore. Files larger than `multipart_threshold` are
+    uploaded in `part_size` chunks, so memory stays bounded for big PDFs.
+    """
+    NOT_FOUND_CODES = ("404", "NoSuchKey", "NotFound")
+
+    def __init__(self, client, bucket, prefix="", multipart_threshold=8 * 1024 * 1024,
+                 part_size=8 * 1024 * 1024):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.multipart_threshold = multipart_threshold
+        self.part_size = part_size
+
+    def _object_key(self, key):
+        return f"{self.prefix}{key}"
+
+    def local_path(self, key):
+        return None  # Never on local disk; callers fall back to read()/open()
+
+    def exists(self, key):
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+            return True
+        except Exception as e:
+            code = str(getattr(e, "response", {}).get("Error", {}).get("Code", ""))
+            if code in self.NOT_FOUND_CODES:
+                return False
+            raise
+
+    def put_file(self, key, src_path):
+        object_key = self._object_key(key)
+        if os.path.getsize(src_path) < self.multipart_threshold:
+            with open(src_path, "rb") as f:
+                self.client.put_object(Bucket=self.bucket, Key=object_key, Body=f,
+                                       ContentType="application/pdf")
+            return
+
+        upload_id = self.client.create_multipart_upload(
+            Bucket=self.bucket, Key=object_key, ContentType="application/pdf"
+        )["UploadId"]
+        try:
+            parts = []
+            with open(src_path, "rb") as f:
+                for part_number, chunk in enumerate(iter(lambda: f.read(self.part_size), b""), start=1):
+                    part = self.client.upload_part(Bucket=self.bucket, Key=object_key, UploadId=upload_id,
+                                                   PartNumber=part_number, Body=chunk)
+                    parts.append({"PartNumber": part_number, "ETag": part["ETag"]})
+            self.client.complete_multipart_upload(Bucket=self.bucket, Key=object_key, UploadId=upload_id,
+                                                  MultipartUpload={"Parts": parts})
+        except Exception:
+            self.client.abort_multipart_upload(Bucket=self.bucket, Key=object_key, UploadId=upload_id)
+            raise
+
+    def open(self, key):
+        return self.client.get_object(Bucket=self.bucket, Key=self._object_key(key))["Body"]
+
+    def read(self, key):
+        return self.open(key).read()
+
+    def delete(self, key):
+        self.client.delete_object(Bucket=self.bucket, Key=self._object_key(key))
+
+
+class ObjectStoreError(Exception):
+    """Mimics botocore's ClientError shape so S3Storage handles both alike."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.response = {"Error": {"Code": code, "Message": message}}
+
+
+class InMemoryObjectStore:
+    """A local, MinIO-like stand-in for the subset of the S3 client API S3Storage uses.
+
+    Objects live in this process only, so use it for development and
+    tests, not with multiple workers.
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = {}
+        self._lock = threading.Lock()
+
+    def head_object(self, Bucket, Key):
+        with self._lock:
+            if (Bucket, Key) not in self.objects:
+                raise ObjectStoreError("404", f"{Key} not found")
+            return {"ContentLength": len(self.objects[(Bucket, Key)])}
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        data = Body.read() if hasattr(Body, "read") else bytes(Body)
+        with self._lock:
+            self.objects[(Bucket, Key)] = data
+        return {"ETag": hashlib.md5(data).hexdigest()}
+
+    def get_object(self, Bucket, Key):
+        with self._lock:
+            if (Bucket, Key) not in self.objects:
+                raise ObjectStoreError("NoSuchKey", f"{Key} not found")
+            data = self.objects[(Bucket, Key)]
+        return {"Body": io.BytesIO(data), "ContentLength": len(data)}
+
+    def delete_object(self, Bucket, Key):
+        with self._lock:
+            self.objects.pop((Bucket, Key), None)
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        data = Body.read() if hasattr(Body, "read") else bytes(Body)
+        with self._lock:
+            self.uploads[UploadId][PartNumber] = data
+        return {"ETag": hashlib.md5(data).hexdigest()}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        with self._lock:
+            parts = self.uploads.pop(UploadId)
+            self.objects[(Bucket, Key)] = b"".join(parts[p["PartNumber"]] for p in MultipartUpload["Parts"])
+        return {}
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        with self._lock:
+            self.uploads.pop(UploadId, None)
+
+
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_storage():
+    """The receipt storage backend selected by Config.RECEIPT_STORAGE_BACKEND."""
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            _storage = _build_storage(Config)
+        return _storage
+
+
+def _build_storage(config):
+    backend = config.RECEIPT_STORAGE_BACKEND
+    if backend == "filesystem":
+        return FilesystemStorage(PDF_DIR)
+    if backend == "memory":
+        return S3Storage(InMemoryObjectStore(), config.RECEIPT_S3_BUCKET, config.RECEIPT_S3_PREFIX)
+    if backend == "s3":
+        try:
+            import boto3
+        except ImportError:
+            raise RuntimeError("RECEIPT_STORAGE_BACKEND=s3 requires the boto3 package")
+        client = boto3.client("s3", endpoint_url=config.RECEIPT_S3_ENDPOINT_URL or None)
+        return S3Storage(client, config.RECEIPT_S3_BUCKET, config.RECEIPT_S3_PREFIX)
+    raise ValueError(f"Unknown RECEIPT_STORAGE_BACKEND: {backend}")
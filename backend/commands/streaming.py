@@ -0,0 +1,35 @@
+import json
+from flask import Response, stream_with_context
+
+EXPORT_FORMATS = ("ndjson", "json")
+
+
+def stream_records(records, fmt="ndjson", filename="export"):
+    """Stream an iterable of dicts as NDJSON or as a chunked JSON array.
+
+    Records are serialized one at a time, so the first bytes leave as soon
+    as the first batch is loaded and memory stays flat for any row count.
+    """
+    if fmt == "json":
+        body, mimetype = _json_array(records), "application/json"
+    else:
+        body, mimetype = _ndjson(records), "application/x-ndjson"
+
+    response = Response(stream_with_context(body), mimetype=mimetype)
+    extension = "json" if fmt == "json" else "ndjson"
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}.{extension}"
+    return response
+
+
+def _ndjson(records):
+    for record in records:
+        yield json.dumps(record, default=str) + "\n"
+
+
+def _json_array(records):
+    yield "["
+    separator = ""
+    for record in records:
+        yield separator + json.dumps(record, default=str)
+        separator = ","
+    yield "]"
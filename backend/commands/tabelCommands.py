@@ -1,7 +1,8 @@
+from commands.pagination import paginate
+from commands.tableAvailability import get_day_availability, invalidate_reservations, slot_bounds
 from dto.tabelDto import TableDTO
-from models import Table
+from models import Table, TableReservation, generate_uuid
 from extensions import db
-import uuid
 from flask import jsonify
 
 class TabelCommands:
@@ -11,9 +12,19 @@ class TabelCommands:
         return [TableDTO(
             b.id, b.booking_id, b.user_id, b.table_number, 
             b.booking_date, b.booking_time, b.booking_status, 
-            b.is_booked
+            b.is_booked, capacity=b.capacity
         ) for b in tables]
 
+    @staticmethod
+    def get_tables_page(limit, after=None):
+        """Fetch one keyset page of tables, returns (DTOs, next_cursor)"""
+        tables, next_cursor = paginate(Table.query, Table.id, limit, after)
+        return [TableDTO(
+            b.id, b.booking_id, b.user_id, b.table_number,
+            b.booking_date, b.booking_time, b.booking_status,
+            b.is_booked, capacity=b.capacity
+        ) for b in tables], next_cursor
+
     @staticmethod
     def get_table_by_id(table_id):
         """Fetch a table by its UUID"""
@@ -24,15 +35,16 @@ class TabelCommands:
             table.id, table.booking_id, table.user_id, 
             table.table_number, table.booking_date, 
             table.booking_time, table.booking_status, 
-            table.is_booked
+            table.is_booked, capacity=table.capacity
         )
 
     @staticmethod
-    def create_table(table_number):
-        """Create a new table with a given table number"""
+    def create_table(table_number, capacity=4):
+        """Create a new table with a given table number and number of seats"""
         new_table = Table(
-            id=str(uuid.uuid4()),  # Store as string UUID
+            id=generate_uuid(),  # Store as string UUID
             table_number=table_number,
+            capacity=capacity,
             booking_id=None,
             user_id=None,
             booking_date=None,
@@ -42,11 +54,12 @@ class TabelCommands:
         )
         db.session.add(new_table)
         db.session.commit()
+        invalidate_reservations()  # Every cached day is missing the new table
         return TableDTO(
             new_table.id, new_table.booking_id, new_table.user_id, 
             new_table.table_number, new_table.booking_date, 
             new_table.booking_time, new_table.booking_status, 
-            new_table.is_booked
+            new_table.is_booked, capacity=new_table.capacity
         )
 
     @staticmethod
@@ -56,16 +69,27 @@ class TabelCommands:
         return [TableDTO(
             t.id, t.booking_id, t.user_id, t.table_number, 
             t.booking_date, t.booking_time, t.booking_status, 
-            t.is_booked
+            t.is_booked, capacity=t.capacity
         ) for t in free_tables]
 
+    @staticmethod
+    def get_available_tables(day, start_time, duration_minutes, party_size=1):
+        """Tables seating `party_size` with no reservation overlapping the slot, as (table_id, table_number, capacity)"""
+        starts_at, ends_at = slot_bounds(day, start_time, duration_minutes)
+        return get_day_availability(day).free_tables(starts_at, ends_at, party_size)
+
     @staticmethod
     def free_table(table_id):
-        """Mark an individual table as free (available)"""
-        table = Table.query.filter_by(id=table_id).first()
+        """Mark an individual table as free (available), dropping its current booking's reservation"""
+        # Same row lock as BookingCommands.assign_table
+        table = Table.query.filter_by(id=table_id).with_for_update().first()
         if not table:
             return None
-        
+
+        booking_date = table.booking_date
+        if table.booking_id is not None:
+            TableReservation.query.filter_by(table_id=table.id, booking_id=table.booking_id).delete()
+
         table.booking_id = None
         table.user_id = None
         table.booking_date = None
@@ -74,9 +98,10 @@ class TabelCommands:
         table.is_booked = False
         
         db.session.commit()
+        invalidate_reservations(booking_date)  # Every day when the booking date is unknown
         return TableDTO(
             table.id, table.booking_id, table.user_id, 
             table.table_number, table.booking_date, 
             table.booking_time, table.booking_status, 
-            table.is_booked
+            table.is_booked, capacity=table.capacity
         )
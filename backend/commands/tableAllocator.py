@@ -0,0 +1,79 @@
+from bisect import bisect_left
+
+
+class TableAllocator:
+    """Best-fit table allocation over one day's DayAvailability.
+
+    A party gets the smallest single free table that seats it. When no
+    single table is big enough it gets the run of adjacent free tables
+    (consecutive table numbers) with the fewest spare seats, then the
+    fewest tables. Every allocation is reserved in `availability` right
+    away, so later parties see it. Pure in-memory: the caller loads the
+    availability and writes the reservations.
+    """
+
+    def __init__(self, availability):
+        self.availability = availability
+        # (table_id, table_number, capacity), smallest tables first
+        self.by_capacity = sorted(availability.tables, key=lambda t: (t[2], t[1]))
+        self.capacities = [table[2] for table in self.by_capacity]
+        self.by_number = availability.tables  # Already ordered by table number
+
+    def allocate(self, party_size, starts_at, ends_at):
+        """Reserve tables for one party; returns their tuples, or None when nothing fits."""
+        tables = self._best_single(party_size, starts_at, ends_at) or self._best_run(party_size, starts_at, ends_at)
+        if tables:
+            for table in tables:
+                self.availability.reserve(table[0], starts_at, ends_at)
+        return tables
+
+    def allocate_all(self, bookings):
+        """Allocate (booking_id, party_size, starts_at, ends_at) tuples in one pass.
+
+        Bookings go in order of start time, largest party first within a
+        slot: filling intervals chronologically packs tables tightly, and
+        big parties have the fewest options. Returns (allocated, unallocated)
+        where allocated maps booking_id to its table tuples.
+        """
+        allocated, unallocated = {}, []
+        # Slot -> smallest party that found no tables. Reservations only
+        # pile up during the pass, so anyone that size or bigger fails too
+        failed = {}
+        for booking_id, party_size, starts_at, ends_at in sorted(bookings, key=lambda b: (b[2], -b[1], b[3])):
+            slot = (starts_at, ends_at)
+            tables = None
+            if party_size < failed.get(slot, float("inf")):
+                tables = self.allocate(party_size, starts_at, ends_at)
+            if tables:
+                allocated[booking_id] = tables
+            else:
+                failed[slot] = min(party_size, failed.get(slot, party_size))
+                unallocated.append(booking_id)
+        return allocated, unallocated
+
+    def _best_single(self, party_size, starts_at, ends_at):
+        # Tables are sorted by capacity, so the first free one that seats the
+        # party wastes the fewest seats
+        for table in self.by_capacity[bisect_left(self.capacities, party_size):]:
+            if self.availability.is_free(table[0], starts_at, ends_at):
+                return [table]
+        return None
+
+    def _best_run(self, party_size, starts_at, ends_at):
+        best, best_key = None, None
+        tables = self.by_number
+        for start in range(len(tables)):
+            seats = 0
+            for end in range(start, len(tables)):
+                table = tables[end]
+                if end > start and table[1] != tables[end - 1][1] + 1:
+                    break  # Gap in the numbering: not adjacent
+                if not self.availability.is_free(table[0], starts_at, ends_at):
+                    break
+                seats += table[2]
+                if seats >= party_size:
+                    key = (seats - party_size, end - start + 1)
+                    if best_key is None or key < best_key:
+                        best, best_key = tables[start:end + 1], key
+                    break
+        return best
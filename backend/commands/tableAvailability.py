@@ -0,0 +1,106 @@
+import datetime
+from bisect import bisect_left, bisect_right
+from commands.cache import LRUCache
+from config import Config
+from extensions import db
+from models import Table, TableReservation
+
+# Date -> DayAvailability; the index is advisory, assign_table re-checks the
+# database under a row lock, so a briefly stale entry can't double-book
+availability_cache = LRUCache(Config.AVAILABILITY_CACHE_MAX_ENTRIES, Config.AVAILABILITY_CACHE_TTL_SECONDS)
+
+
+def slot_bounds(day, start_time, duration_minutes):
+    """(starts_at, ends_at) datetimes for a slot; it may run past midnight."""
+    starts_at = datetime.datetime.combine(day, start_time)
+    return starts_at, starts_at + datetime.timedelta(minutes=duration_minutes)
+
+
+class TableSchedule:
+    """One table's non-overlapping [start, end) reservations, sorted by start."""
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def add(self, start, end):
+        i = bisect_left(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+
+    def copy(self):
+        schedule = TableSchedule()
+        schedule.starts, schedule.ends = list(self.starts), list(self.ends)
+        return schedule
+
+    def is_free(self, start, end):
+        """True when [start, end) overlaps no reservation, in O(log n)."""
+        # The reservation starting at or before `start` must have ended by
+        # then, and the next one must not start before `end`
+        i = bisect_right(self.starts, start)
+        if i and self.ends[i - 1] > start:
+            return False
+        return i == len(self.starts) or self.starts[i] >= end
+
+
+class DayAvailability:
+    """Every table with its reservations around one date, built from the DB."""
+
+    def __init__(self, tables, reservations):
+        # (table_id, table_number, capacity), ordered by table number
+        self.tables = sorted((tuple(table) for table in tables), key=lambda t: (t[1], t[0]))
+        self.schedules = {table[0]: TableSchedule() for table in self.tables}
+        for table_id, starts_at, ends_at in reservations:
+            if table_id in self.schedules:
+                self.schedules[table_id].add(starts_at, ends_at)
+
+    def copy(self):
+        """An independent copy to reserve() in, e.g. of a cached index."""
+        availability = DayAvailability([], [])
+        availability.tables = self.tables
+        availability.schedules = {table_id: schedule.copy() for table_id, schedule in self.schedules.items()}
+        return availability
+
+    def is_free(self, table_id, starts_at, ends_at):
+        return self.schedules[table_id].is_free(starts_at, ends_at)
+
+    def reserve(self, table_id, starts_at, ends_at):
+        self.schedules[table_id].add(starts_at, ends_at)
+
+    def free_tables(self, starts_at, ends_at, min_capacity=1):
+        """(table_id, table_number, capacity) of the tables free for the whole slot."""
+        return [
+            table for table in self.tables
+            if table[2] >= min_capacity and self.is_free(table[0], starts_at, ends_at)
+        ]
+
+
+def load_day_availability(day):
+    """A fresh DayAvailability for `day`, straight from the database."""
+    # Slots start on `day` and may run past midnight, so keep everything
+    # still going at midnight before it and starting up to a day after it
+    window_start = datetime.datetime.combine(day, datetime.time.min)
+    window_end = window_start + datetime.timedelta(days=2)
+    tables = db.session.query(Table.id, Table.table_number, Table.capacity).all()
+    reservations = (
+        db.session.query(TableReservation.table_id, TableReservation.starts_at, TableReservation.ends_at)
+        .filter(TableReservation.starts_at < window_end, TableReservation.ends_at > window_start)
+        .all()
+    )
+    return DayAvailability(tables, reservations)
+
+
+def get_day_availability(day):
+    """The cached DayAvailability for `day`; treat it as read-only."""
+    return availability_cache.get_or_load(day, lambda: load_day_availability(day))
+
+
+def invalidate_reservations(day=None):
+    """Drop the indexes a reservation starting on `day` shows up in, or all of them."""
+    if day is None:
+        availability_cache.invalidate()
+        return
+    # Each index also holds the next day's reservations and anything still
+    # running at its midnight
+    for offset in (-1, 0, 1):
+        availability_cache.invalidate(day + datetime.timedelta(days=offset))
@@ -11,4 +11,10 @@ class OrderStatus(Enum):
     CONFIRMED = "Confirmed"
     CANCELLED = "Cancelled"
     DELIVERED = "Delivered"
-    SENT  ="Sent"  
+    SENT  ="Sent"
+
+
+class ReceiptStatus(Enum):
+    PENDING = "Pending"
+    READY = "Ready"
+    FAILED = "Failed"
@@ -0,0 +1,17 @@
+from quart import Blueprint, Response, jsonify, request
+from commands.asyncFoodCommands import AsyncFoodCommands
+
+# Async variant of food_bp's reads, served by asgi.py; POST /menu and
+# /menu/cache-stats stay on the sync blueprint
+async_food_bp = Blueprint("async_food_bp", __name__)
+
+@async_food_bp.route("/", methods=["GET"])
+async def get_all_food():
+    category = request.args.get("category")  # Get 'category' from query parameters
+    payload = await AsyncFoodCommands.get_menu_payload(category)
+    return payload.make_response(request, Response)
+
+@async_food_bp.route("/categories", methods=["GET"])
+async def get_all_categories():
+    categories = await AsyncFoodCommands.get_all_categories()
+    return jsonify({"categories": categories}), 200
@@ -0,0 +1,46 @@
+from quart import Blueprint, request, jsonify
+from commands.ids import is_uuid
+from commands.asyncOrderCommands import AsyncOrderCommands
+from commands.pagination import parse_page_args
+
+# Async variant of order_bp, served by asgi.py. Routes missing here (send,
+# receipts, export, revenue, delete) fall through to the sync blueprint
+async_order_bp = Blueprint("async_order_bp", __name__)
+
+# 🟢 Create Order
+@async_order_bp.route("/", methods=["POST"])
+async def place_order():
+    data = await request.get_json()
+    if not data or not data.get("user_id") or not data.get("order_items"):
+        return jsonify({"message": "Missing required fields"}), 400
+
+    return await AsyncOrderCommands.place_order(data["user_id"], data["order_items"])
+
+# 📝 Get All Orders
+@async_order_bp.route("/", methods=["GET"])
+async def get_orders():
+    try:
+        page = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return await AsyncOrderCommands.get_all_orders(page)
+
+# 🔍 Get Individual Order
+@async_order_bp.route("/<string:order_id>", methods=["GET"])
+async def get_individual_order(order_id):
+    if not is_uuid(order_id):
+        return jsonify({"error": "Invalid UUID format"}), 400
+    return await AsyncOrderCommands.get_order_by_id(order_id)
+
+# 🟠 Update Order Status
+@async_order_bp.route("/<string:order_id>", methods=["PUT"])
+async def update_order_status(order_id):
+    if not is_uuid(order_id):
+        return jsonify({"error": "Invalid UUID format"}), 400
+
+    data = await request.get_json()
+    status = data.get("status") if data else None
+    if not status:
+        return jsonify({"message": "Status required"}), 400
+
+    return await AsyncOrderCommands.update_order_status(order_id, status)
@@ -1,11 +1,18 @@
+import datetime
 from flask import Blueprint, request, jsonify
 from commands.bookingCommands import BookingCommands
+from commands.ids import validate_path_ids
+from commands.pagination import paginate, page_response, parse_page_args
+from commands.streaming import EXPORT_FORMATS
+from commands.dbRouting import read_only
 from dto.bookingDto import BookingDTO
 from extensions import db
 from models import TableBooking
+from sqlalchemy.orm import selectinload
 import uuid
 
 booking_bp = Blueprint("booking_bp", __name__)
+booking_bp.url_value_preprocessor(validate_path_ids)  # 400 for malformed ids in the URL
 
 @booking_bp.route("/", methods=["POST"])
 def book_table():
@@ -14,19 +21,50 @@ def book_table():
     if not data.get("user_id") or not data.get("date") or not data.get("time"):
         return jsonify({"message": "Missing required fields"}), 400
 
-    booking_dto = BookingCommands.create_booking(data["user_id"], data["date"], data["time"])
+    booking_dto = BookingCommands.create_booking(data["user_id"], data["date"], data["time"], data.get("duration_minutes"), data.get("party_size"))
     # Since create_booking now returns jsonify directly, no need to call to_dict here
     return booking_dto  # Return the response directly from the BookingCommands
 
 @booking_bp.route("/", methods=["GET"])
+@read_only
 def get_all_bookings():
     try:
-        bookings = TableBooking.query.all()
-        # Return all bookings converted into DTOs, including tables
-        return jsonify([BookingDTO(b.id, b.user_id, b.date, b.time, b.status, b.tables).to_dict() for b in bookings]), 200
+        page = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    try:
+        query = TableBooking.query.options(selectinload(TableBooking.tables))
+        if page is None:
+            bookings = query.all()
+            # Return all bookings converted into DTOs, including tables
+            return jsonify([BookingDTO(b.id, b.user_id, b.date, b.time, b.status, b.tables, b.duration_minutes, b.party_size).to_dict() for b in bookings]), 200
+
+        limit, after = page
+        bookings, next_cursor = paginate(query, TableBooking.id, limit, after)
+        items = [BookingDTO(b.id, b.user_id, b.date, b.time, b.status, b.tables, b.duration_minutes, b.party_size).to_dict() for b in bookings]
+        return jsonify(page_response(items, next_cursor)), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@booking_bp.route("/export", methods=["GET"])
+def export_bookings():
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": f"Unsupported format, use one of {', '.join(EXPORT_FORMATS)}"}), 400
+    return BookingCommands.export_bookings(fmt)
+
+@booking_bp.route("/allocate", methods=["POST"])
+def allocate_pending():
+    """Seat every pending booking of a day at once: {"date": "DD-MM-YYYY"}"""
+    data = request.get_json(silent=True) or {}
+    try:
+        day = datetime.datetime.strptime(data.get("date", ""), "%d-%m-%Y").date()
+    except ValueError:
+        return jsonify({"error": "Invalid date format. Use DD-MM-YYYY."}), 400
+
+    return BookingCommands.allocate_pending(day)
+
 @booking_bp.route("/<string:booking_uuid>", methods=["GET"])
 def get_individual_booking(booking_uuid):
     try:
@@ -43,7 +81,9 @@ def get_individual_booking(booking_uuid):
             date=booking.date,
             time=booking.time,
             status=booking.status,
-            tables=booking.tables  # Assuming tables is a related attribute to the booking
+            tables=booking.tables,  # Assuming tables is a related attribute to the booking
+            duration_minutes=booking.duration_minutes,
+            party_size=booking.party_size
         )
 
         return jsonify(booking_dto.to_dict()), 200
@@ -85,6 +125,10 @@ def assign_table(booking_id):
 
     return BookingCommands.assign_table(booking_id, table_number)
 
+@booking_bp.route("/<string:booking_id>/auto-assign", methods=["POST"])
+def auto_assign_table(booking_id):
+    return BookingCommands.auto_assign(booking_id)
+
 @booking_bp.route("/user/<string:user_id>", methods=["GET"])
 def get_by_user_id(user_id):
     try:
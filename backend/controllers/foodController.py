@@ -1,5 +1,7 @@
 from flask import Blueprint, jsonify, request
 from commands.foodCommands import FoodCommands
+from commands.money import parse_money
+from commands.dbRouting import read_only
 
 food_bp = Blueprint("food_bp", __name__)
 
@@ -8,16 +10,25 @@ def add_food():
     data = request.json
     if not all(k in data for k in ("name", "description", "price", "image_url", "category")):
         return jsonify({"message": "Missing required fields"}), 400
-    food_dto = FoodCommands.add_food_item(data["name"], data["description"], data["price"], data["image_url"], data["category"])
+    try:
+        price = parse_money(data["price"])
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+    food_dto = FoodCommands.add_food_item(data["name"], data["description"], price, data["image_url"], data["category"])
     return jsonify(food_dto.to_dict()), 201
 
 @food_bp.route("/", methods=["GET"])
+@read_only
 def get_all_food():
     category = request.args.get("category")  # Get 'category' from query parameters
-    food_items = FoodCommands.get_all_food_items(category)
-    return jsonify([item.to_dict() for item in food_items]), 200
+    # Pre-serialized once per menu version; answers 304 when the ETag matches
+    return FoodCommands.get_menu_payload(category).make_response(request)
 
 @food_bp.route("/categories", methods=["GET"])
 def get_all_categories():
     categories = FoodCommands.get_all_categories()
     return jsonify({"categories": categories}), 200
+
+@food_bp.route("/cache-stats", methods=["GET"])
+def get_cache_stats():
+    return jsonify(FoodCommands.get_cache_stats()), 200
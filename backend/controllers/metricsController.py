@@ -0,0 +1,11 @@
+from flask import Blueprint, jsonify
+from commands.poolMetrics import pool_status
+from extensions import db
+
+metrics_bp = Blueprint("metrics_bp", __name__)
+
+# 📊 Connection Pool Metrics (this worker process only)
+@metrics_bp.route("/pool", methods=["GET"])
+def get_pool_metrics():
+    pools = {bind or "default": pool_status(engine) for bind, engine in db.engines.items()}
+    return jsonify({"pools": pools}), 200
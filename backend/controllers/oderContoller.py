@@ -1,10 +1,14 @@
-import uuid
 import traceback
 from flask import Blueprint, request, jsonify, send_file
+from commands.ids import validate_path_ids
 from commands.orderCommands import OrderCommands
+from commands.pagination import parse_page_args
+from commands.streaming import EXPORT_FORMATS
+from commands.dbRouting import read_only
 from dto.orderDto import OrderDTO
 
 order_bp = Blueprint("order_bp", __name__)
+order_bp.url_value_preprocessor(validate_path_ids)  # 400 for malformed ids in the URL
 
 # 🟢 Create Order
 @order_bp.route("/", methods=["POST"])
@@ -18,17 +22,31 @@ def place_order():
 
 # 📝 Get All Orders
 @order_bp.route("/", methods=["GET"])
+@read_only
 def get_orders():
-    return OrderCommands.get_all_orders()
+    try:
+        page = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return OrderCommands.get_all_orders(page)
+
+# 📦 Export All Orders (streamed)
+@order_bp.route("/export", methods=["GET"])
+def export_orders():
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": f"Unsupported format, use one of {', '.join(EXPORT_FORMATS)}"}), 400
+    return OrderCommands.export_orders(fmt)
+
+# 💰 Revenue Summary
+@order_bp.route("/revenue", methods=["GET"])
+def get_revenue():
+    return OrderCommands.get_revenue(request.args.get("status"))
 
 # 🔍 Get Individual Order
 @order_bp.route("/<string:order_id>", methods=["GET"])
 def get_individual_order(order_id):
-    try:
-        uuid.UUID(order_id)  # Validate UUID format
-        return OrderCommands.get_order_by_id(order_id)
-    except ValueError:
-        return jsonify({"error": "Invalid UUID format"}), 400
+    return OrderCommands.get_order_by_id(order_id)
 
 # 🟠 Update Order Status
 @order_bp.route("/<string:order_id>", methods=["PUT"])
@@ -50,7 +68,12 @@ def delete_order(order_id):
 def send_order(order_id):
     return OrderCommands.send_order(order_id)
 
+# 🧾 Receipt Job Status
+@order_bp.route("/receipts/<string:receipt_id>", methods=["GET"])
+def get_receipt_status(receipt_id):
+    return OrderCommands.get_receipt_status(receipt_id)
+
 # 📥 Download Receipt
 @order_bp.route("/<string:order_id>/receipt", methods=["GET"])
 def download_receipt(order_id):
-    return OrderCommands.download_receipt_by_order_id(order_id)
\ No newline at end of file
+    return OrderCommands.download_receipt_by_order_id(order_id, request)
\ No newline at end of file
@@ -1,13 +1,29 @@
+import datetime
 from flask import Blueprint, request, jsonify
 from commands.tabelCommands import TabelCommands
+from commands.ids import validate_path_ids
+from commands.pagination import page_response, parse_page_args
+from commands.dbRouting import read_only
+from config import Config
 
 tables_bp = Blueprint("tables_bp", __name__)
+tables_bp.url_value_preprocessor(validate_path_ids)  # 400 for malformed ids in the URL
 
 @tables_bp.route("/", methods=["GET"])
+@read_only
 def get_bookings():
-    """Get all tables"""
-    tables = TabelCommands.get_all_tables()
-    return jsonify([t.to_dict() for t in tables])
+    """Get all tables, one keyset page at a time when `limit`/`after` is given"""
+    try:
+        page = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    if page is None:
+        tables = TabelCommands.get_all_tables()
+        return jsonify([t.to_dict() for t in tables])
+
+    tables, next_cursor = TabelCommands.get_tables_page(*page)
+    return jsonify(page_response([t.to_dict() for t in tables], next_cursor))
 
 @tables_bp.route("/<table_id>", methods=["GET"])
 def get_table(table_id):
@@ -24,8 +40,15 @@ def create_table():
     table_number = data.get("table_number")
     if not table_number:
         return jsonify({"error": "Table number is required"}), 400
+
+    try:
+        capacity = int(data.get("capacity", 4))
+    except (TypeError, ValueError):
+        return jsonify({"error": "capacity must be a whole number"}), 400
+    if capacity < 1:
+        return jsonify({"error": "capacity must be positive"}), 400
     
-    table = TabelCommands.create_table(table_number)
+    table = TabelCommands.create_table(table_number, capacity)
     return jsonify(table.to_dict()), 201
 
 @tables_bp.route("/free", methods=["GET"])
@@ -34,6 +57,39 @@ def get_free_tables():
     tables = TabelCommands.get_free_tables()
     return jsonify([t.to_dict() for t in tables])
 
+@tables_bp.route("/available", methods=["GET"])
+def get_available_tables():
+    """Get the tables free for a whole slot: ?date=DD-MM-YYYY&time=HH:MM&duration=minutes[&party_size=n]"""
+    try:
+        day = datetime.datetime.strptime(request.args.get("date", ""), "%d-%m-%Y").date()
+    except ValueError:
+        return jsonify({"error": "Invalid date format. Use DD-MM-YYYY."}), 400
+
+    raw_time = request.args.get("time", "")
+    try:
+        start_time = datetime.datetime.strptime(raw_time, "%H:%M:%S" if raw_time.count(":") == 2 else "%H:%M").time()
+    except ValueError:
+        return jsonify({"error": "Invalid time format. Use HH:MM."}), 400
+
+    try:
+        duration = int(request.args.get("duration", Config.BOOKING_DURATION_MINUTES))
+        party_size = int(request.args.get("party_size", 1))
+    except ValueError:
+        return jsonify({"error": "duration and party_size must be whole numbers"}), 400
+    if duration < 1 or party_size < 1:
+        return jsonify({"error": "duration and party_size must be positive"}), 400
+
+    tables = TabelCommands.get_available_tables(day, start_time, duration, party_size)
+    return jsonify({
+        "date": day.isoformat(),
+        "time": start_time.strftime("%H:%M:%S"),
+        "duration_minutes": duration,
+        "tables": [
+            {"id": table_id, "table_number": table_number, "capacity": capacity}
+            for table_id, table_number, capacity in tables
+        ]
+    })
+
 @tables_bp.route("/free/<table_id>", methods=["PUT"])
 def free_table(table_id):
     """Free an individual table"""
@@ -1,12 +1,14 @@
-import uuid
 import re
 from flask import Blueprint, request, jsonify
 from werkzeug.security import generate_password_hash, check_password_hash
 from sqlalchemy.exc import IntegrityError
+from commands.ids import validate_path_ids
+from commands.pagination import paginate, page_response, parse_page_args
 from extensions import db
-from models import User
+from models import User, generate_uuid
 
 user_bp = Blueprint("user_bp", __name__, url_prefix="/api/users")
+user_bp.url_value_preprocessor(validate_path_ids)  # 400 for malformed ids in the URL
 
 # Email validation regex
 EMAIL_REGEX = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
@@ -54,7 +56,7 @@ def register_user():
 
     hashed_password = generate_password_hash(data["password"], method="pbkdf2:sha256", salt_length=16)
 
-    new_user = User(id=str(uuid.uuid4()), name=data["name"], email=data["email"], password=hashed_password, role=data["role"])
+    new_user = User(id=generate_uuid(), name=data["name"], email=data["email"], password=hashed_password, role=data["role"])
 
     try:
         db.session.add(new_user)
@@ -91,9 +93,18 @@ def get_user(user_id):
 ### ✅ Get All Users API
 @user_bp.route("/", methods=["GET"])
 def get_all_users():
-    users = User.query.all()
-    if not users:
-        return jsonify({"message": "No users found"}), 404
+    try:
+        page = parse_page_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    next_cursor = None
+    if page is None:
+        users = User.query.all()
+        if not users:
+            return jsonify({"message": "No users found"}), 404
+    else:
+        users, next_cursor = paginate(User.query, User.id, *page)
 
     users_list = [
         {
@@ -104,6 +115,8 @@ def get_all_users():
         }
         for user in users
     ]
+    if page is not None:
+        return jsonify(page_response(users_list, next_cursor)), 200
     return jsonify(users_list), 200
 
 ### ✅ Forgot Password API
@@ -1,3 +1,5 @@
+from commands.money import money_to_json
+
 class FoodItemDTO:
     def __init__(self, id, name, description, price, image_url, category):  # Added category
         self.id = id
@@ -12,7 +14,7 @@ class FoodItemDTO:
             "id": self.id,
             "name": self.name,
             "description": self.description,
-            "price": self.price,
+            "price": money_to_json(self.price),
             "image_url": self.image_url,
             "category": self.category  # Added category
         }
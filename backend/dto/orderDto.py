@@ -1,8 +1,10 @@
+from commands.money import money_to_json
+
 class OrderDTO:
     def __init__(self, id, user_id, total_price, status, order_items):
         self.id = id
         self.user_id = user_id
-        self.total_price = total_price
+        self.total_price = money_to_json(total_price)
         self.status = status
         self.order_items = [item.to_dict() for item in order_items]
     
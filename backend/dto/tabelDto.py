@@ -2,7 +2,7 @@ import uuid
 from constants.enums import BookingStatus
 
 class TableDTO:
-    def __init__(self, id=None, booking_id=None, user_id=None, table_number=None, booking_date=None, booking_time=None, booking_status=None, booked=None):
+    def __init__(self, id=None, booking_id=None, user_id=None, table_number=None, booking_date=None, booking_time=None, booking_status=None, booked=None, capacity=None):
         self.id = self.generate_uuid() if id is None else self.convert_uuid(id)
         self.user_id = self.convert_uuid(user_id) if user_id else None
         self.booking_id = self.convert_uuid(booking_id) if booking_id else None
@@ -11,6 +11,7 @@ class TableDTO:
         self.status = booking_status.value if isinstance(booking_status, BookingStatus) else booking_status
         self.table_number = table_number
         self.booked = booked
+        self.capacity = capacity
 
     @staticmethod
     def generate_uuid():
@@ -29,5 +30,6 @@ class TableDTO:
             "time": self.time,
             "status": self.status,  # Now always a string
             "table_number": self.table_number,
-            "booked": self.booked
+            "booked": self.booked,
+            "capacity": self.capacity
         }
@@ -0,0 +1,49 @@
+"""gunicorn settings, each overridable from the environment.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import multiprocessing
+import os
+
+
+def _flag(name, default):
+    return os.environ.get(name, default).lower() in ("1", "true", "yes")
+
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:5000")
+
+# Processes x threads is the number of requests served at once. Each worker
+# process has its own DB pool (DB_POOL_SIZE + DB_MAX_OVERFLOW), so keep
+# workers * that below MySQL's max_connections
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
+worker_class = "gthread" if threads > 1 else "sync"
+
+# Seconds an idle client connection is held open for the next request;
+# raise it above the load balancer's idle timeout when one is in front
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+
+# Recycle workers now and then to cap slow memory growth
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 10000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 1000))
+
+# Load the app once in the master and fork it: faster boot, shared memory
+preload_app = _flag("GUNICORN_PRELOAD", "false")
+
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+errorlog = os.environ.get("GUNICORN_ERROR_LOG", "-")
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    # With preload the engines were created in the master; drop any pooled
+    # connections so no two workers share a socket
+    if preload_app:
+        from extensions import db
+        from wsgi import app
+
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose(close=False)
@@ -0,0 +1,106 @@
+"""binary-uuid-keys
+
+Revision ID: 2f6c8d0e9a41
+Revises: 4800f1010340
+Create Date: 2026-10-18 20:31:26.419355
+
+Opt-in: converts every id and foreign-key column from CHAR(36) to
+BINARY(16) in place when BINARY_UUID_KEYS is enabled, and is a no-op
+otherwise. To switch an existing database later, downgrade to
+4800f1010340 and upgrade again with the flag set. MySQL only.
+
+"""
+from alembic import op
+from alembic.util import CommandError
+import sqlalchemy as sa
+from flask import current_app
+
+
+# revision identifiers, used by Alembic.
+revision = '2f6c8d0e9a41'
+down_revision = '4800f1010340'
+branch_labels = None
+depends_on = None
+
+# (table, column, nullable) for every primary key and the foreign keys pointing at them
+UUID_COLUMNS = [
+    ('users', 'id', False),
+    ('food_items', 'id', False),
+    ('table_bookings', 'id', False),
+    ('table_bookings', 'user_id', False),
+    ('tables', 'id', False),
+    ('tables', 'booking_id', True),
+    ('tables', 'user_id', True),
+    ('orders', 'id', False),
+    ('orders', 'user_id', False),
+    ('order_items', 'id', False),
+    ('order_items', 'order_id', False),
+    ('order_items', 'food_id', False),
+    ('receipts', 'id', False),
+    ('receipts', 'order_id', False),
+]
+
+# 32 hex digits -> canonical 8-4-4-4-12 lowercase form
+TO_CANONICAL = "LOWER(INSERT(INSERT(INSERT(INSERT(HEX({col}), 9, 0, '-'), 14, 0, '-'), 19, 0, '-'), 24, 0, '-'))"
+
+
+def _foreign_keys(bind):
+    inspector = sa.inspect(bind)
+    tables = sorted({table for table, _, _ in UUID_COLUMNS})
+    return [(table, fk) for table in tables for fk in inspector.get_foreign_keys(table)]
+
+
+def _drop_foreign_keys(foreign_keys):
+    # MySQL refuses to change the type of a column used by a foreign key
+    for table, fk in foreign_keys:
+        op.drop_constraint(fk['name'], table, type_='foreignkey')
+
+
+def _restore_foreign_keys(foreign_keys):
+    for table, fk in foreign_keys:
+        op.create_foreign_key(
+            fk['name'], table, fk['referred_table'],
+            fk['constrained_columns'], fk['referred_columns'],
+            ondelete=fk.get('options', {}).get('ondelete')
+        )
+
+
+def _is_binary(bind):
+    column = next(c for c in sa.inspect(bind).get_columns('users') if c['name'] == 'id')
+    return isinstance(column['type'], sa.BINARY)
+
+
+def upgrade():
+    bind = op.get_bind()
+    if not current_app.config.get('BINARY_UUID_KEYS') or _is_binary(bind):
+        return
+    if bind.dialect.name != 'mysql':
+        raise CommandError('binary-uuid-keys only supports MySQL')
+
+    foreign_keys = _foreign_keys(bind)
+    _drop_foreign_keys(foreign_keys)
+
+    # CHAR(36) -> VARBINARY keeps the text bytes, so the data can be rewritten
+    # in place and the existing primary keys and indexes stay attached
+    for table, column, nullable in UUID_COLUMNS:
+        op.execute(f"ALTER TABLE {table} MODIFY {column} VARBINARY(36) {'NULL' if nullable else 'NOT NULL'}")
+        op.execute(f"UPDATE {table} SET {column} = UNHEX(REPLACE({column}, '-', '')) WHERE {column} IS NOT NULL")
+        op.execute(f"ALTER TABLE {table} MODIFY {column} BINARY(16) {'NULL' if nullable else 'NOT NULL'}")
+
+    _restore_foreign_keys(foreign_keys)
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name != 'mysql' or not _is_binary(bind):
+        return
+
+    foreign_keys = _foreign_keys(bind)
+    _drop_foreign_keys(foreign_keys)
+
+    for table, column, nullable in UUID_COLUMNS:
+        op.execute(f"ALTER TABLE {table} MODIFY {column} VARBINARY(36) {'NULL' if nullable else 'NOT NULL'}")
+        op.execute(f"UPDATE {table} SET {column} = {TO_CANONICAL.format(col=column)} WHERE {column} IS NOT NULL")
+        op.execute(f"ALTER TABLE {table} MODIFY {column} VARCHAR(36) {'NULL' if nullable else 'NOT NULL'}")
+
+    _restore_foreign_keys(foreign_keys)
@@ -0,0 +1,89 @@
+"""table-reservations
+
+Revision ID: 3f385ea90ae6
+Revises: dabeae564fad
+Create Date: 2026-10-18 21:52:38.914260
+
+"""
+import datetime
+import uuid
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f385ea90ae6'
+down_revision = 'dabeae564fad'
+branch_labels = None
+depends_on = None
+
+DEFAULT_DURATION_MINUTES = 90
+
+
+def _is_binary(bind):
+    column = next(c for c in sa.inspect(bind).get_columns('tables') if c['name'] == 'id')
+    return isinstance(column['type'], sa.BINARY)
+
+
+def upgrade():
+    bind = op.get_bind()
+    # Follow however the existing keys are stored (see 2f6c8d0e9a41)
+    binary = _is_binary(bind)
+    uuid_type = sa.BINARY(16) if binary else sa.String(length=36)
+
+    with op.batch_alter_table('table_bookings', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('duration_minutes', sa.Integer(), nullable=False,
+                                      server_default=str(DEFAULT_DURATION_MINUTES)))
+
+    reservations = op.create_table('table_reservations',
+    sa.Column('table_id', uuid_type, nullable=False),
+    sa.Column('booking_id', uuid_type, nullable=False),
+    sa.Column('starts_at', sa.DateTime(), nullable=False),
+    sa.Column('ends_at', sa.DateTime(), nullable=False),
+    sa.Column('id', uuid_type, nullable=False),
+    sa.ForeignKeyConstraint(['booking_id'], ['table_bookings.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['table_id'], ['tables.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('id')
+    )
+    with op.batch_alter_table('table_reservations', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_table_reservations_booking_id'), ['booking_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_table_reservations_starts_at'), ['starts_at'], unique=False)
+        batch_op.create_index('ix_table_reservations_table_id_starts_at', ['table_id', 'starts_at'], unique=False)
+
+    # Carry over the one assignment each table could hold so far
+    tables = sa.table('tables',
+        sa.column('id', uuid_type),
+        sa.column('booking_id', uuid_type),
+        sa.column('booking_date', sa.Date()),
+        sa.column('booking_time', sa.Time()),
+    )
+    assigned = bind.execute(
+        sa.select(tables.c.id, tables.c.booking_id, tables.c.booking_date, tables.c.booking_time)
+        .where(tables.c.booking_id.is_not(None), tables.c.booking_date.is_not(None), tables.c.booking_time.is_not(None))
+    ).all()
+    rows = []
+    for table_id, booking_id, booking_date, booking_time in assigned:
+        starts_at = datetime.datetime.combine(booking_date, booking_time)
+        new_id = uuid.uuid4()
+        rows.append({
+            'id': new_id.bytes if binary else str(new_id),
+            'table_id': table_id,
+            'booking_id': booking_id,
+            'starts_at': starts_at,
+            'ends_at': starts_at + datetime.timedelta(minutes=DEFAULT_DURATION_MINUTES),
+        })
+    if rows:
+        op.bulk_insert(reservations, rows)
+
+
+def downgrade():
+    with op.batch_alter_table('table_reservations', schema=None) as batch_op:
+        batch_op.drop_index('ix_table_reservations_table_id_starts_at')
+        batch_op.drop_index(batch_op.f('ix_table_reservations_starts_at'))
+        batch_op.drop_index(batch_op.f('ix_table_reservations_booking_id'))
+
+    op.drop_table('table_reservations')
+
+    with op.batch_alter_table('table_bookings', schema=None) as batch_op:
+        batch_op.drop_column('duration_minutes')
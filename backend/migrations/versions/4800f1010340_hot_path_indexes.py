@@ -0,0 +1,60 @@
+"""hot-path-indexes
+
+Revision ID: 4800f1010340
+Revises: b8213e107c85
+Create Date: 2026-10-18 20:05:51.873120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4800f1010340'
+down_revision = 'b8213e107c85'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.create_index('ix_orders_user_id_status', ['user_id', 'status'], unique=False)
+
+    with op.batch_alter_table('table_bookings', schema=None) as batch_op:
+        batch_op.create_index('ix_table_bookings_user_id_date', ['user_id', 'date'], unique=False)
+
+    with op.batch_alter_table('tables', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_tables_is_booked'), ['is_booked'], unique=False)
+        batch_op.create_index(batch_op.f('ix_tables_table_number'), ['table_number'], unique=False)
+
+    with op.batch_alter_table('food_items', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_food_items_category'), ['category'], unique=False)
+        batch_op.create_index(batch_op.f('ix_food_items_name'), ['name'], unique=False)
+
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_order_items_order_id'), ['order_id'], unique=False)
+
+    with op.batch_alter_table('receipts', schema=None) as batch_op:
+        batch_op.create_index('ix_receipts_order_id_created_at', ['order_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('receipts', schema=None) as batch_op:
+        batch_op.drop_index('ix_receipts_order_id_created_at')
+
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_order_items_order_id'))
+
+    with op.batch_alter_table('food_items', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_food_items_name'))
+        batch_op.drop_index(batch_op.f('ix_food_items_category'))
+
+    with op.batch_alter_table('tables', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_tables_table_number'))
+        batch_op.drop_index(batch_op.f('ix_tables_is_booked'))
+
+    with op.batch_alter_table('table_bookings', schema=None) as batch_op:
+        batch_op.drop_index('ix_table_bookings_user_id_date')
+
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_index('ix_orders_user_id_status')
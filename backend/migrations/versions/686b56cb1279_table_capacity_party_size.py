@@ -0,0 +1,32 @@
+"""table-capacity-party-size
+
+Revision ID: 686b56cb1279
+Revises: 3f385ea90ae6
+Create Date: 2026-10-18 22:27:15.603841
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '686b56cb1279'
+down_revision = '3f385ea90ae6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tables', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('capacity', sa.Integer(), nullable=False, server_default='4'))
+
+    with op.batch_alter_table('table_bookings', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('party_size', sa.Integer(), nullable=False, server_default='2'))
+
+
+def downgrade():
+    with op.batch_alter_table('table_bookings', schema=None) as batch_op:
+        batch_op.drop_column('party_size')
+
+    with op.batch_alter_table('tables', schema=None) as batch_op:
+        batch_op.drop_column('capacity')
@@ -0,0 +1,33 @@
+"""receipt-render-status
+
+Revision ID: 74de06422871
+Revises: e9237f834798
+Create Date: 2026-10-18 19:02:45.530117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '74de06422871'
+down_revision = 'e9237f834798'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Receipts that already exist were rendered synchronously, so they are Ready
+    with op.batch_alter_table('receipts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('status', sa.String(length=20), nullable=False, server_default='Ready'))
+        batch_op.alter_column('file_path', existing_type=sa.String(length=255), nullable=True)
+
+    with op.batch_alter_table('receipts', schema=None) as batch_op:
+        batch_op.alter_column('status', existing_type=sa.String(length=20), server_default=None)
+
+
+def downgrade():
+    op.execute("DELETE FROM receipts WHERE file_path IS NULL")
+    with op.batch_alter_table('receipts', schema=None) as batch_op:
+        batch_op.alter_column('file_path', existing_type=sa.String(length=255), nullable=False)
+        batch_op.drop_column('status')
@@ -0,0 +1,30 @@
+"""receipt-content-hash
+
+Revision ID: b8213e107c85
+Revises: 74de06422871
+Create Date: 2026-10-18 19:41:07.204583
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8213e107c85'
+down_revision = '74de06422871'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing flat-layout receipts keep a NULL hash until `flask receipts rebuild`
+    # moves them into the content-addressed layout
+    with op.batch_alter_table('receipts', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=64), nullable=True))
+        batch_op.create_index(batch_op.f('ix_receipts_content_hash'), ['content_hash'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('receipts', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_receipts_content_hash'))
+        batch_op.drop_column('content_hash')
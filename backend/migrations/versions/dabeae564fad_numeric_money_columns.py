@@ -0,0 +1,42 @@
+"""numeric-money-columns
+
+Revision ID: dabeae564fad
+Revises: 2f6c8d0e9a41
+Create Date: 2026-10-18 21:14:07.402518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'dabeae564fad'
+down_revision = '2f6c8d0e9a41'
+branch_labels = None
+depends_on = None
+
+# (table, column) pairs holding money, all NOT NULL
+MONEY_COLUMNS = (
+    ('food_items', 'price'),
+    ('orders', 'total_price'),
+    ('order_items', 'unit_price'),
+)
+
+
+def upgrade():
+    # The database rounds the existing FLOAT values to the nearest cent
+    for table, column in MONEY_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column,
+                                  existing_type=sa.Float(),
+                                  type_=sa.Numeric(precision=10, scale=2),
+                                  existing_nullable=False)
+
+
+def downgrade():
+    for table, column in MONEY_COLUMNS:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.alter_column(column,
+                                  existing_type=sa.Numeric(precision=10, scale=2),
+                                  type_=sa.Float(),
+                                  existing_nullable=False)
@@ -0,0 +1,39 @@
+"""order-item-price-snapshot
+
+Revision ID: e9237f834798
+Revises: cf8712cadfa6
+Create Date: 2026-10-18 18:40:12.118402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9237f834798'
+down_revision = 'cf8712cadfa6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('food_name', sa.String(length=100), nullable=True))
+        batch_op.add_column(sa.Column('unit_price', sa.Float(), nullable=True))
+
+    # Backfill existing rows from the current menu before making the columns required
+    op.execute("""
+        UPDATE order_items
+        SET food_name = (SELECT food_items.name FROM food_items WHERE food_items.id = order_items.food_id),
+            unit_price = (SELECT food_items.price FROM food_items WHERE food_items.id = order_items.food_id)
+    """)
+
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.alter_column('food_name', existing_type=sa.String(length=100), nullable=False)
+        batch_op.alter_column('unit_price', existing_type=sa.Float(), nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('order_items', schema=None) as batch_op:
+        batch_op.drop_column('unit_price')
+        batch_op.drop_column('food_name')
@@ -1,20 +1,80 @@
+import secrets
+import threading
+import time
 import uuid
-from sqlalchemy import Column, String, Float, Integer, Date, Time, ForeignKey
+from sqlalchemy import BINARY, Column, String, Numeric, Integer, Date, Time, ForeignKey, Index
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.sql import func
-from app import db
+from extensions import db
 from sqlalchemy import Enum as SQLAlchemyEnum
-from constants.enums import BookingStatus
+from config import Config
+from commands.money import MONEY_PRECISION, MONEY_SCALE
+from constants.enums import BookingStatus, ReceiptStatus
+
+_uuid_lock = threading.Lock()
+_last_uuid_ms = 0
+_uuid_counter = 0
 
 # Generate UUID as a string
 def generate_uuid():
-    return str(uuid.uuid4())
+    """Time-ordered UUIDv7 (RFC 9562) as a canonical 36-char string.
+
+    The leading 48 bits are the Unix time in milliseconds and the next 12
+    bits a counter that keeps ids from one process strictly increasing
+    within the same millisecond. New rows therefore append to the end of
+    the clustered primary key instead of landing on random pages, and
+    ids sort by creation time, which makes them usable as keyset cursors.
+    """
+    global _last_uuid_ms, _uuid_counter
+    with _uuid_lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_uuid_ms:
+            _last_uuid_ms = now_ms
+            _uuid_counter = secrets.randbits(11)  # Random start, with room left to count up
+        else:
+            # Same millisecond (or the clock stepped back): count, and borrow
+            # the next millisecond if the counter runs out
+            _uuid_counter += 1
+            if _uuid_counter > 0xFFF:
+                _last_uuid_ms += 1
+                _uuid_counter = 0
+        timestamp_ms, counter = _last_uuid_ms, _uuid_counter
+
+    value = (timestamp_ms << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | secrets.randbits(62)
+    return str(uuid.UUID(int=value))
+
+class BinaryUUID(TypeDecorator):
+    """UUID stored as BINARY(16) but read and written as the canonical 36-char string.
+
+    Less than half the width of CHAR(36) in every primary key, foreign key
+    and secondary index, while the rest of the app keeps using strings.
+    """
+    impl = BINARY(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return uuid.UUID(str(value)).bytes  # Raises ValueError for malformed ids
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=bytes(value)))
+
+# Column type for ids and the foreign keys pointing at them; BINARY(16) is
+# opt-in via BINARY_UUID_KEYS and needs migration 2f6c8d0e9a41 applied with it
+UUIDType = BinaryUUID() if Config.BINARY_UUID_KEYS else String(36)
+
+# Exact cents for prices and totals; values come back as Decimal
+MoneyType = Numeric(MONEY_PRECISION, MONEY_SCALE)
 
 class BaseModel(db.Model):
     """Base model to handle UUID ID fields"""
     __abstract__ = True
-    id = Column(String(36), primary_key=True, default=generate_uuid, unique=True, nullable=False)
+    id = Column(UUIDType, primary_key=True, default=generate_uuid, unique=True, nullable=False)
 
 class User(BaseModel):
     __tablename__ = 'users'  # Explicit table name
@@ -31,45 +91,77 @@ class User(BaseModel):
 
 class TableBooking(BaseModel):
     __tablename__ = 'table_bookings'
-    user_id = Column(String(36), ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
+    __table_args__ = (Index('ix_table_bookings_user_id_date', 'user_id', 'date'),)
+    user_id = Column(UUIDType, ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
     date = Column(Date, nullable=False)
     time = Column(Time, nullable=False)
     status = Column(String(50), default="Pending")
-    tables = relationship('Table', backref='booking', lazy=True)
+    duration_minutes = Column(Integer, nullable=False, default=Config.BOOKING_DURATION_MINUTES)
+    party_size = Column(Integer, nullable=False, default=2)
+    # Tables reserved for this booking
+    tables = relationship('Table', secondary='table_reservations', viewonly=True, lazy=True,
+                          order_by='Table.table_number')
 
 class Table(BaseModel):
     __tablename__ = 'tables'
-    booking_id = Column(String(36), ForeignKey('table_bookings.id', ondelete="SET NULL"), nullable=True)
-    user_id = Column(String(36), ForeignKey('users.id', ondelete="SET NULL"), nullable=True)
-    table_number = Column(Integer, nullable=False)
+    booking_id = Column(UUIDType, ForeignKey('table_bookings.id', ondelete="SET NULL"), nullable=True)
+    user_id = Column(UUIDType, ForeignKey('users.id', ondelete="SET NULL"), nullable=True)
+    table_number = Column(Integer, nullable=False, index=True)
     booking_date = Column(Date, nullable=True)
     booking_time = Column(Time, nullable=True)
     booking_status = Column(SQLAlchemyEnum(BookingStatus), default=BookingStatus.AVAILABLE.value, nullable=False) 
-    is_booked = Column(db.Boolean, default=False)
+    is_booked = Column(db.Boolean, default=False, index=True)
+    capacity = Column(Integer, nullable=False, default=4)  # Seats; tables with consecutive numbers stand side by side
+
+class TableReservation(BaseModel):
+    """A table held for one booking over [starts_at, ends_at).
+
+    A table can hold any number of reservations as long as they don't
+    overlap; BookingCommands.assign_table enforces that under a row lock
+    on the table. The booking/is_booked columns on Table only describe
+    its latest assignment.
+    """
+    __tablename__ = 'table_reservations'
+    __table_args__ = (Index('ix_table_reservations_table_id_starts_at', 'table_id', 'starts_at'),)
+    table_id = Column(UUIDType, ForeignKey('tables.id', ondelete="CASCADE"), nullable=False)
+    booking_id = Column(UUIDType, ForeignKey('table_bookings.id', ondelete="CASCADE"), nullable=False, index=True)
+    starts_at = Column(db.DateTime, nullable=False, index=True)
+    ends_at = Column(db.DateTime, nullable=False)
 
 class FoodItem(BaseModel):
     __tablename__ = 'food_items'
-    name = Column(String(100), nullable=False)
+    name = Column(String(100), nullable=False, index=True)
     description = Column(String(255), nullable=False)
-    price = Column(Float, nullable=False)
+    price = Column(MoneyType, nullable=False)
     image_url = Column(String(255), nullable=True)
-    category = Column(String(50), nullable=False)
+    category = Column(String(50), nullable=False, index=True)
 
 class Order(BaseModel):
     __tablename__ = 'orders'
-    user_id = Column(String(36), ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
-    total_price = Column(Float, nullable=False)
+    __table_args__ = (Index('ix_orders_user_id_status', 'user_id', 'status'),)
+    user_id = Column(UUIDType, ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
+    total_price = Column(MoneyType, nullable=False)
     status = Column(String(50), default="Pending")
-    order_items = relationship('OrderItem', backref='order', lazy=True)
+    order_items = relationship('OrderItem', backref='order', lazy=True, order_by='OrderItem.id')
 
 class OrderItem(BaseModel):
     __tablename__ = 'order_items'
-    order_id = Column(String(36), ForeignKey('orders.id', ondelete="CASCADE"), nullable=False)
-    food_id = Column(String(36), ForeignKey('food_items.id', ondelete="CASCADE"), nullable=False)
+    order_id = Column(UUIDType, ForeignKey('orders.id', ondelete="CASCADE"), nullable=False, index=True)
+    food_id = Column(UUIDType, ForeignKey('food_items.id', ondelete="CASCADE"), nullable=False)
     quantity = Column(Integer, nullable=False)
+    # Snapshot of the menu row at order time, so receipts and reports
+    # never need to join food_items
+    food_name = Column(String(100), nullable=False)
+    unit_price = Column(MoneyType, nullable=False)
+    food = relationship('FoodItem', lazy=True)
 
 class Receipt(BaseModel):
     __tablename__ = 'receipts'
-    order_id = Column(String(36), ForeignKey('orders.id', ondelete="CASCADE"), nullable=False)
-    file_path = Column(String(255), nullable=False)
+    # Receipt downloads look up an order's latest receipt
+    __table_args__ = (Index('ix_receipts_order_id_created_at', 'order_id', 'created_at'),)
+    order_id = Column(UUIDType, ForeignKey('orders.id', ondelete="CASCADE"), nullable=False)
+    file_path = Column(String(255), nullable=True)  # Storage key, set once the PDF has been rendered
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the stored PDF
+    status = Column(String(20), default=ReceiptStatus.PENDING.value, nullable=False)
     created_at = Column(db.DateTime, default=func.current_timestamp())
+    order = relationship('Order', lazy=True)
@@ -0,0 +1,104 @@
+import datetime
+import pytest
+from commands import tableAvailability
+from extensions import db
+from models import Table, TableReservation
+
+SLOT = "/tables/available?date=01-01-2030&time=19:00&duration=90"
+
+
+def assign(client, booking_id, table_number=1):
+    return client.post(f"/bookings/{booking_id}/assign-table", json={"table_number": table_number})
+
+
+@pytest.fixture
+def taken_slot(app, client, seed_bookings):
+    """Table 1 assigned to the first of two bookings for the same slot; returns (table_id, booking_ids)."""
+    booking_ids = seed_bookings(app, [datetime.time(19, 0)] * 2)
+    response = assign(client, booking_ids[0])
+    assert response.status_code == 200
+    assert assign(client, booking_ids[1]).status_code == 400
+    assert client.get(SLOT).get_json()["tables"] == []  # Also fills the availability cache
+    return response.get_json()["table"]["id"], booking_ids
+
+
+def test_freed_table_can_be_assigned_again(app, client, taken_slot):
+    table_id, booking_ids = taken_slot
+
+    assert client.put(f"/tables/free/{table_id}").status_code == 200
+
+    assert [t["table_number"] for t in client.get(SLOT).get_json()["tables"]] == [1]
+    assert assign(client, booking_ids[1]).status_code == 200
+
+
+def test_deleted_booking_releases_its_tables(app, client, taken_slot):
+    _, booking_ids = taken_slot
+
+    assert client.delete(f"/bookings/{booking_ids[0]}").status_code == 200
+
+    with app.app_context():
+        assert TableReservation.query.filter_by(booking_id=booking_ids[0]).count() == 0
+    assert [t["table_number"] for t in client.get(SLOT).get_json()["tables"]] == [1]
+    assert assign(client, booking_ids[1]).status_code == 200
+
+
+def test_assign_table_response_lists_capacity_and_tables(app, client, seed_bookings):
+    [booking_id] = seed_bookings(app, [datetime.time(19, 0)])
+
+    body = assign(client, booking_id).get_json()
+
+    assert body["table"]["capacity"] == 4
+    assert [table["table_number"] for table in body["booking"]["tables"]] == [1]
+
+
+def test_availability_invalidated_while_loading_is_not_cached(app, monkeypatch):
+    day = datetime.date(2030, 1, 1)
+    load = tableAvailability.load_day_availability
+
+    def load_racing_an_assignment(loaded_day):
+        availability = load(loaded_day)
+        tableAvailability.invalidate_reservations(loaded_day)  # Another request committed meanwhile
+        return availability
+
+    monkeypatch.setattr(tableAvailability, "load_day_availability", load_racing_an_assignment)
+    with app.app_context():
+        tableAvailability.get_day_availability(day)
+
+    assert tableAvailability.availability_cache.get(day) is None
+
+
+def test_auto_assign_rechecks_a_stale_plan(app, client, seed_bookings):
+    booking_ids = seed_bookings(app, [datetime.time(19, 0)] * 2, tables=2)
+    assert len(client.get(SLOT).get_json()["tables"]) == 2  # Cached: both tables free
+
+    # Table 1 taken behind the cache's back, e.g. by another worker
+    with app.app_context():
+        table = Table.query.filter_by(table_number=1).one()
+        db.session.add(TableReservation(
+            table_id=table.id, booking_id=booking_ids[0],
+            starts_at=datetime.datetime(2030, 1, 1, 19, 0), ends_at=datetime.datetime(2030, 1, 1, 20, 30)
+        ))
+        db.session.commit()
+
+    response = client.post(f"/bookings/{booking_ids[1]}/auto-assign")
+
+    assert response.status_code == 200
+    assert [t["table_number"] for t in response.get_json()["tables"]] == [2]
+    assert client.post(f"/bookings/{booking_ids[1]}/auto-assign").status_code == 400  # Already seated
+
+
+def test_allocate_seats_pending_bookings_in_one_pass(app, client, seed_bookings):
+    # Three parties at 19:00 for two tables; the 21:00 one reuses a table
+    booking_ids = seed_bookings(app, [datetime.time(19, 0)] * 3 + [datetime.time(21, 0)], tables=2)
+
+    response = client.post("/bookings/allocate", json={"date": "01-01-2030"})
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["allocated"] == {booking_ids[0]: [1], booking_ids[1]: [2], booking_ids[3]: [1]}
+    assert body["unallocated"] == [booking_ids[2]]
+
+    # Seated bookings aren't pending any more; the leftover still has no table
+    again = client.post("/bookings/allocate", json={"date": "01-01-2030"}).get_json()
+    assert again["allocated"] == {}
+    assert again["unallocated"] == [booking_ids[2]]
@@ -0,0 +1,42 @@
+from commands.cache import LRUCache
+
+
+def test_key_invalidated_while_loading_is_not_stored():
+    cache = LRUCache()
+    checkpoint = cache.checkpoint()
+    cache.invalidate("receipt")  # e.g. the render finished meanwhile
+
+    cache.set("receipt", "stale", checkpoint)
+    cache.set("other", "fine", checkpoint)
+
+    assert cache.get("receipt") is None
+    assert cache.get("other") == "fine"
+
+
+def test_whole_invalidation_while_loading_drops_every_key():
+    cache = LRUCache()
+    checkpoint = cache.checkpoint()
+    cache.invalidate()
+
+    cache.set("menu", "stale", checkpoint)
+
+    assert cache.get("menu") is None
+
+
+def test_load_after_invalidation_is_stored():
+    cache = LRUCache()
+    cache.invalidate("receipt")
+
+    assert cache.get_or_load("receipt", lambda: "fresh") == "fresh"
+    assert cache.get("receipt") == "fresh"
+
+
+def test_per_key_stamps_stay_bounded():
+    cache = LRUCache(max_entries=4)
+    checkpoint = cache.checkpoint()
+    for i in range(10):
+        cache.invalidate(i)
+
+    assert len(cache._key_generations) <= 4
+    cache.set(0, "stale", checkpoint)  # Still recognised as stale
+    assert cache.get(0) is None
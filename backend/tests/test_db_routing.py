@@ -0,0 +1,54 @@
+import time
+import pytest
+from commands.dbRouting import PRIMARY_UNTIL_HEADER
+from extensions import db
+from models import Table
+
+
+@pytest.fixture
+def replicated_app(app_factory, tmp_path):
+    """App with a primary and one replica, each its own SQLite file."""
+    app = app_factory(
+        "primary.sqlite",
+        SQLALCHEMY_BINDS={"replica_0": f"sqlite:///{tmp_path / 'replica.sqlite'}"},
+        REPLICA_STICKY_SECONDS=5,
+    )
+    with app.app_context():
+        db.metadata.create_all(db.engines["replica_0"])
+        # A row only the replica has tells the two apart
+        with db.engines["replica_0"].begin() as connection:
+            connection.execute(Table.__table__.insert(), [{
+                "id": "01a15060-0000-7000-8000-000000000099", "table_number": 99,
+                "booking_status": "AVAILABLE", "is_booked": False, "capacity": 4,
+            }])
+    return app
+
+
+def table_numbers(client, headers=None):
+    return sorted(table["table_number"] for table in client.get("/tables/", headers=headers).json)
+
+
+def test_reads_go_to_the_replica(replicated_app):
+    client = replicated_app.test_client()
+    assert table_numbers(client) == [99]
+
+
+def test_writer_reads_its_own_writes_from_the_primary(replicated_app):
+    client = replicated_app.test_client()
+    response = client.post("/tables/create", json={"table_number": 1})
+    assert response.status_code == 201
+    primary_until = response.headers[PRIMARY_UNTIL_HEADER]
+    assert float(primary_until) > time.time()
+    # Cross-origin clients can only read the header if CORS exposes it
+    assert PRIMARY_UNTIL_HEADER in response.headers["Access-Control-Expose-Headers"]
+
+    assert table_numbers(client, {PRIMARY_UNTIL_HEADER: primary_until}) == [1]
+    # Other clients, and this one once the window has passed, use the replica
+    assert table_numbers(client) == [99]
+    assert table_numbers(client, {PRIMARY_UNTIL_HEADER: f"{time.time() - 1:.3f}"}) == [99]
+
+
+def test_reads_do_not_extend_the_window(replicated_app):
+    client = replicated_app.test_client()
+    response = client.get("/tables/")
+    assert PRIMARY_UNTIL_HEADER not in response.headers
@@ -0,0 +1,37 @@
+import pytest
+
+
+@pytest.mark.parametrize("method, path", [
+    ("get", "/tables/abc"),
+    ("put", "/tables/free/abc"),
+    ("get", "/users/abc"),
+    ("delete", "/users/abc"),
+    ("get", "/bookings/abc"),
+    ("put", "/bookings/abc"),
+    ("delete", "/bookings/abc"),
+    ("post", "/bookings/abc/assign-table"),
+    ("post", "/bookings/abc/auto-assign"),
+    ("get", "/bookings/user/abc"),
+    ("get", "/orders/abc"),
+    ("put", "/orders/abc"),
+    ("delete", "/orders/abc"),
+    ("post", "/orders/abc/send"),
+    ("get", "/orders/abc/receipt"),
+    ("get", "/orders/receipts/abc"),
+])
+def test_malformed_path_ids_are_rejected(client, method, path):
+    response = getattr(client, method)(path, json={"status": "Confirmed", "table_number": 1})
+    assert response.status_code == 400
+    assert response.json == {"error": "Invalid UUID format"}
+
+
+@pytest.mark.parametrize("path", ["/orders/", "/bookings/", "/tables/", "/users/"])
+def test_malformed_page_cursor_is_rejected(client, path):
+    response = client.get(f"{path}?limit=1&after=zzz")
+    assert response.status_code == 400
+    assert "after" in response.json["error"]
+
+
+def test_well_formed_missing_id_is_not_found(client):
+    response = client.get("/tables/01a15060-5e4e-7107-952d-6c673bb88d6d")
+    assert response.status_code == 404
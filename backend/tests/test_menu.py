@@ -0,0 +1,44 @@
+import gzip
+import pytest
+
+
+@pytest.fixture
+def menu(client):
+    for name in ("Soup", "Salad"):
+        response = client.post("/menu/", json={
+            "name": name, "description": "Test dish", "price": "4.50", "image_url": None, "category": "Starters"
+        })
+        assert response.status_code == 201
+    return client
+
+
+def test_matching_etag_gives_304_without_body(menu):
+    etag = menu.get("/menu/").headers["ETag"]
+
+    response = menu.get("/menu/", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_gzip_variant_has_its_own_etag_and_same_content(menu):
+    identity = menu.get("/menu/")
+
+    response = menu.get("/menu/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == identity.headers["ETag"][:-1] + '-gzip"'
+    assert gzip.decompress(response.data) == identity.data
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+def test_menu_write_changes_the_etag(menu):
+    etag = menu.get("/menu/").headers["ETag"]
+
+    menu.post("/menu/", json={"name": "Bread", "description": "Test dish", "price": "2.00", "image_url": None, "category": "Starters"})
+    response = menu.get("/menu/", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert "Bread" in [item["name"] for item in response.get_json()]
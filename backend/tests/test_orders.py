@@ -0,0 +1,55 @@
+import pytest
+from models import Order, User
+
+
+def test_get_orders_query_count_is_flat(app, client, count_queries, seed_orders):
+    seed_orders(5)
+    count_queries()
+    response = client.get("/orders/")
+    assert response.status_code == 200
+    assert len(response.json) == 5
+    small = count_queries()
+
+    seed_orders(45)
+    count_queries()
+    response = client.get("/orders/")
+    assert response.status_code == 200
+    assert len(response.json) == 50
+    assert all(len(order["order_items"]) == 3 for order in response.json)
+
+    assert count_queries() == small
+
+
+def test_place_order_computes_total_from_menu(app, client, seed_orders):
+    seed_orders(0)
+    with app.app_context():
+        user_id = User.query.first().id
+
+    response = client.post("/orders/", json={
+        "user_id": user_id,
+        "order_items": [{"name": "Dish 0", "quantity": 2, "price": 0.01}, {"name": "Dish 1", "quantity": 1}]
+    })
+    assert response.status_code == 201
+    assert response.json["total_price"] == 13.5
+
+
+@pytest.mark.parametrize("item", [
+    {"name": "Dish 0", "quantity": -3},
+    {"name": "Dish 0", "quantity": 0},
+    {"name": "Dish 0", "quantity": "2"},
+    {"name": "Dish 0", "quantity": 1.5},
+    {"name": "Dish 0", "quantity": True},
+    {"name": "Dish 0"},
+    {"quantity": 1},
+    {"name": ["Dish 0"], "quantity": 1},
+    "Dish 0",
+])
+def test_place_order_rejects_bad_lines(app, client, item, seed_orders):
+    seed_orders(0)
+    with app.app_context():
+        user_id = User.query.first().id
+
+    response = client.post("/orders/", json={"user_id": user_id, "order_items": [item]})
+    assert response.status_code == 400
+    with app.app_context():
+        assert Order.query.count() == 0
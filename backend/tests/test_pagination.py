@@ -0,0 +1,48 @@
+import datetime
+import pytest
+from commands.pagination import MAX_PAGE_SIZE
+
+
+def walk(client, path, limit):
+    """Follow next_cursor from the first page to the last; returns the item ids in the order served."""
+    ids, after = [], None
+    while True:
+        response = client.get(f"{path}?limit={limit}" + (f"&after={after}" if after else ""))
+        assert response.status_code == 200
+        page = response.get_json()
+        assert len(page["items"]) <= limit
+        ids += [item["id"] for item in page["items"]]
+        after = page["next_cursor"]
+        if after is None:
+            return ids
+
+
+def test_orders_pages_cover_every_row_once_in_id_order(client, seed_orders):
+    seed_orders(7, items_per_order=1)
+    everything = [order["id"] for order in client.get("/orders/").get_json()]
+
+    ids = walk(client, "/orders/", 3)
+
+    assert ids == sorted(everything)
+
+
+def test_bookings_pages_cover_every_row_once_in_id_order(app, client, seed_bookings):
+    booking_ids = seed_bookings(app, [datetime.time(18, 0)] * 5)
+
+    assert walk(client, "/bookings/", 2) == sorted(booking_ids)
+
+
+def test_limit_is_capped(client, seed_orders):
+    seed_orders(MAX_PAGE_SIZE + 1, items_per_order=1)
+
+    page = client.get(f"/orders/?limit={MAX_PAGE_SIZE * 2}").get_json()
+
+    assert len(page["items"]) == MAX_PAGE_SIZE
+    assert page["next_cursor"] == page["items"][-1]["id"]
+
+
+@pytest.mark.parametrize("limit", ["0", "-1", "abc"])
+def test_bad_limit_is_rejected(client, limit):
+    response = client.get(f"/orders/?limit={limit}")
+    assert response.status_code == 400
+    assert "limit" in response.get_json()["error"]
@@ -0,0 +1,58 @@
+import os
+import pytest
+from commands.receiptStorage import InMemoryObjectStore, S3Storage
+
+
+@pytest.fixture
+def big_file(tmp_path):
+    """Seven full 512-byte parts and a short last one"""
+    path = tmp_path / "receipt.pdf"
+    path.write_bytes(os.urandom(7 * 512 + 100))
+    return path
+
+
+def test_large_file_is_uploaded_in_parts(big_file):
+    store = InMemoryObjectStore()
+    uploaded_parts = []
+    upload_part = store.upload_part
+
+    def record_part(**kwargs):
+        uploaded_parts.append(len(kwargs["Body"]))
+        return upload_part(**kwargs)
+
+    store.upload_part = record_part
+    storage = S3Storage(store, "b", multipart_threshold=1024, part_size=512)
+
+    storage.put_file("ab/cd/receipt.pdf", str(big_file))
+
+    assert uploaded_parts == [512] * 7 + [100]
+    assert storage.read("ab/cd/receipt.pdf") == big_file.read_bytes()
+    assert store.uploads == {}
+
+
+def test_failed_part_aborts_the_upload(big_file):
+    store = InMemoryObjectStore()
+    upload_part = store.upload_part
+
+    def flaky_part(**kwargs):
+        if kwargs["PartNumber"] == 3:
+            raise ConnectionError("connection reset")
+        return upload_part(**kwargs)
+
+    aborted = []
+    abort_multipart_upload = store.abort_multipart_upload
+
+    def record_abort(**kwargs):
+        aborted.append(kwargs["UploadId"])
+        return abort_multipart_upload(**kwargs)
+
+    store.upload_part = flaky_part
+    store.abort_multipart_upload = record_abort
+    storage = S3Storage(store, "b", multipart_threshold=1024, part_size=512)
+
+    with pytest.raises(ConnectionError):
+        storage.put_file("ab/cd/receipt.pdf", str(big_file))
+
+    assert len(aborted) == 1
+    assert store.uploads == {}
+    assert not storage.exists("ab/cd/receipt.pdf")
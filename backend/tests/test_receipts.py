@@ -0,0 +1,48 @@
+from commands import receiptStorage
+from commands.receiptStorage import InMemoryObjectStore, S3Storage
+from constants.enums import ReceiptStatus
+from extensions import db
+from models import Order, Receipt
+
+
+def test_rebuild_stores_receipts_in_the_parent(app, monkeypatch, seed_orders):
+    # The in-memory backend only exists in this process: anything a worker
+    # process stored would be lost
+    storage = S3Storage(InMemoryObjectStore(), "receipts")
+    monkeypatch.setattr(receiptStorage, "_storage", storage)
+
+    seed_orders(4)
+    with app.app_context():
+        for order in Order.query.all():
+            db.session.add(Receipt(order_id=order.id, status=ReceiptStatus.PENDING.value))
+        db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["receipts", "rebuild", "--workers", "2"])
+    assert result.exit_code == 0, result.output
+    assert "Rendered 4 receipts (0 failed)" in result.output
+
+    with app.app_context():
+        receipts = Receipt.query.all()
+        assert {receipt.status for receipt in receipts} == {ReceiptStatus.READY.value}
+        for receipt in receipts:
+            assert storage.exists(receipt.file_path)
+            assert storage.read(receipt.file_path).startswith(b"%PDF")
+
+
+def test_cached_receipt_is_reloaded_after_another_worker_changes_the_order(app, client, seed_orders):
+    seed_orders(1)
+    with app.app_context():
+        order_id = str(Order.query.one().id)
+
+    first = client.get(f"/orders/{order_id}/receipt")
+    assert first.status_code == 200
+    assert client.get(f"/orders/{order_id}/receipt").headers["ETag"] == first.headers["ETag"]
+
+    # Written behind this process's back, so receipt_cache is never invalidated
+    with app.app_context():
+        Order.query.get(order_id).status = "Delivered"
+        db.session.commit()
+
+    second = client.get(f"/orders/{order_id}/receipt")
+    assert second.status_code == 200
+    assert second.headers["ETag"] != first.headers["ETag"]
@@ -0,0 +1,95 @@
+import datetime
+import pytest
+from commands.tableAllocator import TableAllocator
+from commands.tableAvailability import DayAvailability
+
+
+def at(hour, minute=0):
+    return datetime.datetime(2030, 1, 1, hour, minute)
+
+
+def allocator(*capacities, numbers=None):
+    """Tables t1, t2, ... numbered 1, 2, ... (or `numbers`) with the given capacities, all free"""
+    numbers = numbers or range(1, len(capacities) + 1)
+    tables = [(f"t{number}", number, capacity) for number, capacity in zip(numbers, capacities)]
+    return TableAllocator(DayAvailability(tables, []))
+
+
+def numbers(tables):
+    return [table[1] for table in tables] if tables else tables
+
+
+@pytest.mark.parametrize("party_size, expected", [(1, [2]), (2, [2]), (3, [1]), (5, [3])])
+def test_smallest_table_that_seats_the_party(party_size, expected):
+    # Capacities 4, 2, 6: not in size order, so the pick isn't just the first
+    assert numbers(allocator(4, 2, 6).allocate(party_size, at(19), at(20))) == expected
+
+
+def test_run_with_fewest_spare_seats_wins_over_fewer_tables():
+    # 1+2+3 seats 7 exactly; 3+4 seats 9 with fewer tables
+    assert numbers(allocator(2, 2, 3, 6).allocate(7, at(19), at(20))) == [1, 2, 3]
+
+
+def test_run_with_fewest_tables_breaks_a_tie_on_spare_seats():
+    # 1+2+3 and 4+5 both seat 7 exactly
+    assert numbers(allocator(2, 2, 3, 6, 1).allocate(7, at(19), at(20))) == [4, 5]
+
+
+def test_gap_in_table_numbers_breaks_a_run():
+    tables = allocator(4, 4, 4, numbers=[1, 2, 4])
+
+    assert tables.allocate(12, at(19), at(20)) is None  # 2 and 4 aren't adjacent
+    assert numbers(tables.allocate(8, at(19), at(20))) == [1, 2]
+
+
+def test_busy_table_breaks_a_run():
+    tables = allocator(4, 4, 4)
+    tables.availability.reserve("t2", at(19), at(20))
+
+    assert tables.allocate(8, at(19), at(20)) is None
+
+
+def test_overlapping_slot_is_rejected_and_back_to_back_allowed():
+    tables = allocator(4)
+    assert numbers(tables.allocate(2, at(19), at(20, 30))) == [1]
+
+    assert tables.allocate(2, at(20), at(21)) is None  # Overlaps the end
+    assert tables.allocate(2, at(18), at(19, 30)) is None  # Overlaps the start
+    assert numbers(tables.allocate(2, at(20, 30), at(22))) == [1]  # Starts as the first ends
+    assert numbers(tables.allocate(2, at(17), at(19))) == [1]  # Ends as the first starts
+
+
+class CountingAllocator(TableAllocator):
+    def __init__(self, availability):
+        super().__init__(availability)
+        self.attempts = []
+
+    def allocate(self, party_size, starts_at, ends_at):
+        self.attempts.append(party_size)
+        return super().allocate(party_size, starts_at, ends_at)
+
+
+def test_allocate_all_skips_parties_no_smaller_than_a_failed_one_in_that_slot():
+    tables = CountingAllocator(DayAvailability([("t1", 1, 4), ("t2", 2, 2)], []))
+    bookings = [
+        ("a", 4, at(19), at(20)),
+        ("b", 4, at(19), at(20)),  # Fails: table 1 is taken and table 2 alone seats 2
+        ("c", 4, at(19), at(20)),  # Same slot, same size: skipped without searching
+        ("d", 2, at(19), at(20)),  # Smaller: still tried, and seated
+        ("e", 4, at(20), at(21)),  # Another slot: tried, and seated
+    ]
+
+    allocated, unallocated = tables.allocate_all(bookings)
+
+    assert {booking_id: numbers(seated) for booking_id, seated in allocated.items()} == {"a": [1], "d": [2], "e": [1]}
+    assert unallocated == ["b", "c"]
+    assert tables.attempts == [4, 4, 2, 4]
+
+
+def test_allocate_all_seats_larger_parties_first_within_a_slot():
+    tables = TableAllocator(DayAvailability([("t1", 1, 2), ("t2", 2, 4)], []))
+
+    allocated, unallocated = tables.allocate_all([("small", 2, at(19), at(20)), ("big", 4, at(19), at(20))])
+
+    assert {booking_id: numbers(seated) for booking_id, seated in allocated.items()} == {"big": [2], "small": [1]}
+    assert unallocated == []
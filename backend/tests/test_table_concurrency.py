@@ -0,0 +1,80 @@
+import datetime
+import threading
+from extensions import db
+from models import TableReservation
+
+# Row locks only mean something on InnoDB, so these run on `mysql_app`
+# and skip without TEST_MYSQL_URL
+
+
+def post_concurrently(app, requests):
+    """POST every (path, json) at once, one thread each; returns the status codes."""
+    barrier = threading.Barrier(len(requests))
+    statuses = [None] * len(requests)
+
+    def post(i, path, body):
+        client = app.test_client()
+        barrier.wait()  # Release every request together
+        statuses[i] = client.post(path, json=body).status_code
+
+    threads = [threading.Thread(target=post, args=(i, *request)) for i, request in enumerate(requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return statuses
+
+
+def assign_concurrently(app, assignments):
+    """assign-table every (booking_id, table_number) at once; returns the status codes."""
+    return post_concurrently(app, [
+        (f"/bookings/{booking_id}/assign-table", {"table_number": table_number})
+        for booking_id, table_number in assignments
+    ])
+
+
+def reservations_by_table(app):
+    with app.app_context():
+        rows = db.session.query(TableReservation.table_id, TableReservation.starts_at, TableReservation.ends_at).all()
+    by_table = {}
+    for table_id, starts_at, ends_at in rows:
+        by_table.setdefault(table_id, []).append((starts_at, ends_at))
+    return by_table
+
+
+def test_same_slot_is_never_double_booked(mysql_app, seed_bookings):
+    tables, requests = 4, 48
+    booking_ids = seed_bookings(mysql_app, [datetime.time(19, 0)] * requests, tables=tables)
+
+    statuses = assign_concurrently(mysql_app, [(booking_id, i % tables + 1) for i, booking_id in enumerate(booking_ids)])
+
+    # One winner per table, everyone else told it's taken
+    assert sorted(statuses) == [200] * tables + [400] * (requests - tables)
+    assert sorted(len(slots) for slots in reservations_by_table(mysql_app).values()) == [1] * tables
+
+
+def test_overlapping_slots_never_share_a_table(mysql_app, seed_bookings):
+    # 90-minute bookings starting every 15 minutes all want table 1
+    starts = [datetime.time(17 + minutes // 60, minutes % 60) for minutes in range(0, 6 * 60, 15)]
+    booking_ids = seed_bookings(mysql_app, starts * 2)
+
+    statuses = assign_concurrently(mysql_app, [(booking_id, 1) for booking_id in booking_ids])
+
+    assert set(statuses) <= {200, 400}
+    [slots] = reservations_by_table(mysql_app).values()
+    assert len(slots) == statuses.count(200)
+    slots.sort()
+    assert all(ends_at <= next_starts_at for (_, ends_at), (next_starts_at, _) in zip(slots, slots[1:]))
+
+
+def test_concurrent_auto_assigns_seat_each_table_once(mysql_app, seed_bookings):
+    tables, requests = 6, 24
+    booking_ids = seed_bookings(mysql_app, [datetime.time(19, 0)] * requests, tables=tables)
+    mysql_app.test_client().get("/tables/available?date=01-01-2030&time=19:00&duration=90")  # Warm, soon stale, index
+
+    # Each booking twice: the second attempt must not seat it again
+    statuses = post_concurrently(mysql_app, [(f"/bookings/{booking_id}/auto-assign", None) for booking_id in booking_ids * 2])
+
+    assert set(statuses) <= {200, 400}
+    assert statuses.count(200) == tables
+    assert sorted(len(slots) for slots in reservations_by_table(mysql_app).values()) == [1] * tables
@@ -0,0 +1,37 @@
+// src/api/primaryUntil.ts
+import axios from "axios";
+
+// The API may serve reads from lagging replicas. After a write it answers
+// with X-DB-Primary-Until (a Unix time in seconds); sending it back until
+// then keeps our reads on the primary, so we see what we just wrote.
+const PRIMARY_UNTIL_HEADER = "X-DB-Primary-Until";
+const STORAGE_KEY = "dbPrimaryUntil";
+
+export const rememberPrimaryUntil = (value: string | null | undefined) => {
+  if (value) {
+    sessionStorage.setItem(STORAGE_KEY, value);
+  }
+};
+
+const primaryUntil = () => {
+  const value = sessionStorage.getItem(STORAGE_KEY);
+  if (value && Number(value) > Date.now() / 1000) {
+    return value;
+  }
+  sessionStorage.removeItem(STORAGE_KEY);
+  return null;
+};
+
+// Every axios call in the app goes through the default instance
+axios.interceptors.request.use((config) => {
+  const value = primaryUntil();
+  if (value) {
+    config.headers.set(PRIMARY_UNTIL_HEADER, value);
+  }
+  return config;
+});
+
+axios.interceptors.response.use((response) => {
+  rememberPrimaryUntil(response.headers[PRIMARY_UNTIL_HEADER.toLowerCase()]);
+  return response;
+});
@@ -42,7 +42,7 @@ const OrderList = () => {
     setLoading(orderId);
     try {
       const response = await axios.post(`http://127.0.0.1:5000/orders/${orderId}/send`);
-      if (response.status === 200) {
+      if (response.status === 200 || response.status === 202) {
         setSentOrders((prev) => [...prev, orderId]);
         setSuccessMessage(`Order ${orderId} sent successfully!`);
         
@@ -3,6 +3,7 @@ import { Button } from "@radix-ui/themes";
 import dayjs from "dayjs"; // Import dayjs
 import { toast, ToastContainer } from "react-toastify"; // Import toast from react-toastify
 import "react-toastify/dist/ReactToastify.css"; // Import the styles for the toast
+import { rememberPrimaryUntil } from "../api/primaryUntil";
 // import "./BookingForm.css"; // Import styles
 
 const BookingForm = () => {
@@ -55,6 +56,8 @@ const BookingForm = () => {
       if (!response.ok) {
         throw new Error("Failed to make the booking");
       }
+      // So the Bookings tab reads the new booking from the primary
+      rememberPrimaryUntil(response.headers.get("X-DB-Primary-Until"));
 
       const data = await response.json();
       
@@ -4,6 +4,7 @@ import { createRoot } from 'react-dom/client'
 import { Theme } from "@radix-ui/themes";
 
 import App from './App.tsx'
+import './api/primaryUntil.ts'
 import { QueryClientProvider } from '@tanstack/react-query';
 import queryClient from './tanstack/queryClient.ts';
 